@@ -2,7 +2,7 @@
 LLM Client for Claude API integration
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 import anthropic
 from loguru import logger
 
@@ -13,7 +13,8 @@ class LLMClient:
     """Client for interacting with Claude API"""
     
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.CLAUDE_API_KEY)
+        # Async client so concurrent generate_text() calls don't block the event loop
+        self.client = anthropic.AsyncAnthropic(api_key=settings.CLAUDE_API_KEY)
         self.model_routing = {
             "simple": settings.CLAUDE_MODEL_SIMPLE,
             "standard": settings.CLAUDE_MODEL_STANDARD,
@@ -64,7 +65,7 @@ class LLMClient:
         try:
             logger.info(f"Calling Claude API with model: {model}")
             
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
@@ -86,6 +87,54 @@ class LLMClient:
             logger.error(f"Error calling Claude API: {str(e)}")
             raise
     
+    async def generate_text_stream(
+        self,
+        prompt: str,
+        question_type: str = "standard",
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream text from Claude API as it is generated
+        
+        Closing the generator early (e.g. via contextlib.aclosing) closes the
+        underlying stream, so the caller stops paying for unread tokens.
+        
+        Args:
+            prompt: The prompt to send to Claude
+            question_type: Type of question for model selection
+            max_tokens: Maximum tokens in response
+            temperature: Temperature for generation
+            **kwargs: Additional parameters for the API
+        
+        Yields:
+            Text deltas in arrival order
+        """
+        model = self.select_model(question_type)
+        
+        try:
+            logger.info(f"Streaming from Claude API with model: {model}")
+            
+            async with self.client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                **kwargs
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+            
+        except Exception as e:
+            logger.error(f"Error streaming from Claude API: {str(e)}")
+            raise
+    
     async def analyze_document(
         self,
         document_content: str,
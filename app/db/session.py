@@ -2,18 +2,38 @@
 Database session management
 """
 
-from typing import Generator
+from typing import Any, Dict, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.core.config import settings
 
-# Create synchronous engine for SQLite
+
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """Driver-specific engine options"""
+    url = make_url(database_url)
+    options: Dict[str, Any] = {
+        # Rows per multi-VALUES INSERT when executemany is batched
+        "insertmanyvalues_page_size": 1000,
+    }
+    
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}  # Needed for SQLite
+    elif url.get_driver_name() == "psycopg2":
+        # Batch executemany() (bulk inserts/updates from seed/index scripts)
+        options["executemany_mode"] = "values_plus_batch"
+        options["executemany_batch_page_size"] = 500
+    
+    return options
+
+
+# Create synchronous engine
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    **_engine_options(settings.DATABASE_URL)
 )
 
 # Create session factory
@@ -33,4 +53,4 @@ def get_db() -> Generator:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -6,7 +6,7 @@ Handles all interactions with Anthropic Claude API
 import os
 from typing import Optional, Dict, Any, List
 import anthropic
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 import base64
 from loguru import logger
 
@@ -35,7 +35,8 @@ class ClaudeService:
             if not self.api_key:
                 raise ValueError("Claude API key not found. Set CLAUDE_API_KEY environment variable.")
             
-            self.client = Anthropic(api_key=self.api_key)
+            # Async client: analyze_* are coroutines and must not block the event loop
+            self.client = AsyncAnthropic(api_key=self.api_key)
         
         # Model configurations
         self.models = {
@@ -171,7 +172,7 @@ class ClaudeService:
             # Only Sonnet and Opus support PDF input
             if model in [self.models["sonnet"], self.models["opus"]]:
                 # Use beta API with PDF document
-                message = self.client.beta.messages.create(
+                message = await self.client.beta.messages.create(
                     model=model,
                     max_tokens=4000,
                     temperature=0.1,
@@ -210,7 +211,7 @@ class ClaudeService:
 
 질문에 대해 구체적이고 정확한 답변을 제공해주세요."""
                 
-                message = self.client.messages.create(
+                message = await self.client.messages.create(
                     model=model,
                     max_tokens=4000,
                     temperature=0.1,
@@ -333,7 +334,7 @@ class ClaudeService:
             # Call Claude API
             logger.info(f"Comparing {len(companies)} companies with Claude")
             
-            message = self.client.beta.messages.create(
+            message = await self.client.beta.messages.create(
                 model=model,
                 max_tokens=4000,
                 temperature=0.1,
@@ -4,6 +4,7 @@ Handles document retrieval and management
 """
 
 import os
+import re
 from loguru import logger
 from typing import Optional, List, Dict, Tuple
 from pathlib import Path
@@ -17,6 +18,18 @@ from app.services.pdf_processor import PDFProcessor
 class DocumentService:
     """Service for managing and retrieving documents"""
     
+    # Known companies and their short-form variations
+    COMPANIES = ["마인이스", "우나스텔라", "설로인"]
+    COMPANY_VARIATIONS = {
+        "마인": "마인이스",
+        "우나": "우나스텔라",
+        "스텔라": "우나스텔라"
+    }
+    
+    # Compiled once; extraction runs for every incoming question
+    YEAR_PATTERN = re.compile(r'20\d{2}')
+    SHORT_YEAR_PATTERN = re.compile(r'(\d{2})년')
+    
     def __init__(self, db: Session):
         self.db = db
         self.pdf_processor = PDFProcessor()
@@ -24,22 +37,13 @@ class DocumentService:
     
     def extract_company_from_question(self, question: str) -> Optional[str]:
         """Extract company name from user question"""
-        # List of known companies
-        companies = ["마인이스", "우나스텔라", "설로인"]
-        
         question_lower = question.lower()
-        for company in companies:
+        for company in self.COMPANIES:
             if company.lower() in question_lower:
                 return company
         
         # Try variations
-        variations = {
-            "마인": "마인이스",
-            "우나": "우나스텔라",
-            "스텔라": "우나스텔라"
-        }
-        
-        for variant, company in variations.items():
+        for variant, company in self.COMPANY_VARIATIONS.items():
             if variant in question_lower:
                 return company
         
@@ -47,15 +51,13 @@ class DocumentService:
     
     def extract_year_from_question(self, question: str) -> Optional[int]:
         """Extract year from user question"""
-        import re
-        
         # Pattern for 4-digit year
-        year_match = re.search(r'20\d{2}', question)
+        year_match = self.YEAR_PATTERN.search(question)
         if year_match:
             return int(year_match.group())
         
         # Pattern for 2-digit year with 년
-        year_match = re.search(r'(\d{2})년', question)
+        year_match = self.SHORT_YEAR_PATTERN.search(question)
         if year_match:
             year = int(year_match.group(1))
             return 2000 + year if year < 50 else 1900 + year
@@ -7,7 +7,7 @@ import io
 import os
 import subprocess
 import logging
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Union
 from enum import Enum
 from pathlib import Path
 import tempfile
@@ -294,15 +294,40 @@ class PDFOptimizer:
             metadata["pymupdf_error"] = str(e)
             return pdf_content, metadata
     
-    def is_image_based_pdf(self, pdf_content: bytes) -> bool:
-        """Check if PDF is primarily image-based (scanned document)"""
+    def is_image_based_pdf(
+        self,
+        pdf_content: Union[bytes, str, os.PathLike],
+        sample_pages: Optional[int] = None
+    ) -> bool:
+        """
+        Check if PDF is primarily image-based (scanned document)
+        
+        Args:
+            pdf_content: PDF content, or a path to open the file directly
+                (only the xref and the inspected pages are then read)
+            sample_pages: Inspect only this many evenly spaced pages instead of
+                all of them; the text threshold is scaled to the sampled share
+                of the document
+        """
         try:
-            pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
+            if isinstance(pdf_content, (str, os.PathLike)):
+                pdf_document = fitz.open(pdf_content)
+            else:
+                pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
+            
+            num_pages = len(pdf_document)
+            if sample_pages and 0 < sample_pages < num_pages:
+                step = (num_pages - 1) / max(sample_pages - 1, 1)
+                page_numbers = sorted({round(i * step) for i in range(sample_pages)})
+            else:
+                page_numbers = range(num_pages)
             
             total_text_chars = 0
             total_images = 0
             
-            for page in pdf_document:
+            for page_num in page_numbers:
+                page = pdf_document[page_num]
+                
                 # Count text characters
                 text = page.get_text()
                 total_text_chars += len(text.strip())
@@ -313,10 +338,14 @@ class PDFOptimizer:
             
             pdf_document.close()
             
-            # If very little text and has images, it's likely scanned
-            is_scanned = total_text_chars < 100 and total_images > 0
+            # If very little text and has images, it's likely scanned; the
+            # 100-char limit applies to the whole document, so scale it down
+            # to the pages actually inspected
+            text_threshold = 100 * len(page_numbers) / num_pages if num_pages else 100
+            is_scanned = total_text_chars < text_threshold and total_images > 0
             
-            logger.info(f"PDF analysis - Text chars: {total_text_chars}, Images: {total_images}, Is scanned: {is_scanned}")
+            logger.info(f"PDF analysis - Pages checked: {len(page_numbers)}/{num_pages}, "
+                       f"Text chars: {total_text_chars}, Images: {total_images}, Is scanned: {is_scanned}")
             
             return is_scanned
             
@@ -41,6 +41,38 @@ class PDFSplitter:
         Returns:
             List of split file info and metadata
         """
+        return self._check_and_split(pdf_content, filename, pages_per_chunk)
+    
+    def check_and_split_doc(
+        self,
+        pdf_document: fitz.Document,
+        pdf_content: bytes,
+        filename: str = "document.pdf",
+        pages_per_chunk: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Same as check_and_split, but for a PDF the caller has already opened
+        
+        The document is not closed here, so it can be reused across calls.
+        
+        Args:
+            pdf_document: Opened PDF document
+            pdf_content: PDF file content the document was opened from
+            filename: Original filename
+            pages_per_chunk: Number of pages per split file
+            
+        Returns:
+            List of split file info and metadata
+        """
+        return self._check_and_split(pdf_content, filename, pages_per_chunk, pdf_document)
+    
+    def _check_and_split(
+        self,
+        pdf_content: bytes,
+        filename: str,
+        pages_per_chunk: Optional[int],
+        pdf_document: Optional[fitz.Document] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         file_size = len(pdf_content)
         file_size_mb = file_size / (1024 * 1024)
         
@@ -61,7 +93,7 @@ class PDFSplitter:
                 "filename": filename,
                 "size": file_size,
                 "size_mb": round(file_size_mb, 2),
-                "pages": self._get_page_count(pdf_content),
+                "pages": self._get_page_count(pdf_content, pdf_document),
                 "part_number": None
             }], metadata
         
@@ -72,7 +104,8 @@ class PDFSplitter:
         split_files = self._split_pdf(
             pdf_content, 
             filename, 
-            pages_per_chunk or self.default_pages_per_chunk
+            pages_per_chunk or self.default_pages_per_chunk,
+            pdf_document
         )
         
         metadata["split_performed"] = True
@@ -81,8 +114,14 @@ class PDFSplitter:
         
         return split_files, metadata
     
-    def _get_page_count(self, pdf_content: bytes) -> int:
+    def _get_page_count(
+        self,
+        pdf_content: bytes,
+        pdf_document: Optional[fitz.Document] = None
+    ) -> int:
         """Get total page count from PDF"""
+        if pdf_document is not None:
+            return len(pdf_document)
         try:
             pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
             page_count = len(pdf_document)
@@ -96,13 +135,16 @@ class PDFSplitter:
         self, 
         pdf_content: bytes, 
         filename: str, 
-        pages_per_chunk: int
+        pages_per_chunk: int,
+        pdf_document: Optional[fitz.Document] = None
     ) -> List[Dict[str, Any]]:
-        """Split PDF into smaller chunks"""
+        """Split PDF into smaller chunks (opens pdf_content unless a document is given)"""
         split_files = []
+        owns_document = pdf_document is None
         
         try:
-            pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
+            if owns_document:
+                pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
             total_pages = len(pdf_document)
             
             # Calculate number of chunks needed
@@ -164,7 +206,8 @@ class PDFSplitter:
                 
                 chunk_pdf.close()
             
-            pdf_document.close()
+            if owns_document:
+                pdf_document.close()
             
             return split_files
             
@@ -176,7 +219,7 @@ class PDFSplitter:
                 "filename": filename,
                 "size": len(pdf_content),
                 "size_mb": round(len(pdf_content) / (1024 * 1024), 2),
-                "pages": self._get_page_count(pdf_content),
+                "pages": self._get_page_count(pdf_content, pdf_document),
                 "part_number": None,
                 "error": str(e)
             }]
@@ -196,8 +239,25 @@ class PDFSplitter:
         Returns:
             Optimal number of pages per chunk
         """
+        return self._calculate_optimal_chunk_size(pdf_content, target_chunk_size_mb)
+    
+    def calculate_optimal_chunk_size_doc(
+        self,
+        pdf_document: fitz.Document,
+        pdf_content: bytes,
+        target_chunk_size_mb: float = 8.0
+    ) -> int:
+        """Same as calculate_optimal_chunk_size, but for an already opened PDF"""
+        return self._calculate_optimal_chunk_size(pdf_content, target_chunk_size_mb, pdf_document)
+    
+    def _calculate_optimal_chunk_size(
+        self,
+        pdf_content: bytes,
+        target_chunk_size_mb: float,
+        pdf_document: Optional[fitz.Document] = None
+    ) -> int:
         try:
-            total_pages = self._get_page_count(pdf_content)
+            total_pages = self._get_page_count(pdf_content, pdf_document)
             if total_pages == 0:
                 return self.default_pages_per_chunk
             
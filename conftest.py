@@ -0,0 +1,14 @@
+"""
+pytest fixtures for the standalone test scripts in the project root
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Context-managed TestClient shared by the tests in a module"""
+    from test_fastapi_direct import make_client
+    
+    with make_client() as client:
+        yield client
@@ -0,0 +1,89 @@
+"""
+On-disk response cache for the Claude/embedding test scripts
+
+The test prompts are fixed, so repeated runs would otherwise pay for the
+same completions every time. Entries are JSON files under .cache/llm/ keyed
+by the SHA-256 of the call inputs and expire after CACHE_TTL_SECONDS.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "llm"
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Toggled off by --no-cache for fresh benchmarking
+enabled = True
+
+_MISSING = object()
+
+
+def _make_key(kind: str, **inputs: Any) -> str:
+    payload = json.dumps({"kind": kind, **inputs}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load(key: str) -> Any:
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return _MISSING
+
+    if time.time() - entry["stored_at"] > CACHE_TTL_SECONDS:
+        path.unlink(missing_ok=True)
+        return _MISSING
+    return entry["value"]
+
+
+def _store(key: str, value: Any) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / f"{key}.json"
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps({"stored_at": time.time(), "value": value}, ensure_ascii=False),
+        encoding="utf-8"
+    )
+    tmp_path.replace(path)
+
+
+async def cached_call(kind: str, call, **key_inputs: Any) -> Any:
+    """Return the cached result for key_inputs, awaiting call() on a miss"""
+    if not enabled:
+        return await call()
+
+    key = _make_key(kind, **key_inputs)
+    value = _load(key)
+    if value is not _MISSING:
+        logger.debug(f"Cache hit ({kind}): {key[:12]}")
+        return value
+
+    value = await call()
+    _store(key, value)
+    return value
+
+
+async def cached_generate(client, **kwargs) -> str:
+    """Cached LLMClient.generate_text"""
+    return await cached_call("generate_text", lambda: client.generate_text(**kwargs), **kwargs)
+
+
+async def cached_analyze(client, **kwargs) -> dict:
+    """Cached LLMClient.analyze_document"""
+    return await cached_call("analyze_document", lambda: client.analyze_document(**kwargs), **kwargs)
+
+
+def cache_embeddings(embedding_client, model_name: Optional[str] = None):
+    """Route embedding_client.embed_text through the cache (patches the instance only)"""
+    embed_text = embedding_client.embed_text
+
+    async def cached_embed_text(text):
+        return await cached_call("embed_text", lambda: embed_text(text), text=text, model=model_name)
+
+    embedding_client.embed_text = cached_embed_text
+    return embedding_client
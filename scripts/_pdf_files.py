@@ -0,0 +1,44 @@
+"""
+PDF file discovery shared by the seed, index and test scripts
+
+Walks directories with os.scandir, so directory checks come from the listing
+itself instead of a separate stat per entry, and yields lazily so callers can
+stop after the first few files.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator, Tuple, Union
+
+PathLike = Union[str, os.PathLike]
+
+
+def iter_pdf_entries(root: PathLike) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every PDF file under root (symlinks are not followed)"""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                entries = list(entries)
+        except FileNotFoundError:
+            continue
+        
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.name.endswith(".pdf") and entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def iter_pdf_paths(root: PathLike) -> Iterator[str]:
+    """Yield the path of every PDF file under root"""
+    for entry in iter_pdf_entries(root):
+        yield entry.path
+
+
+def iter_company_pdfs(root: PathLike) -> Iterator[Tuple[str, str, os.DirEntry]]:
+    """Yield (company, year, DirEntry) for every {company}/{year}/*.pdf file under root"""
+    for entry in iter_pdf_entries(root):
+        parts = Path(os.path.relpath(entry.path, root)).parts
+        if len(parts) == 3:
+            yield parts[0], parts[1], entry
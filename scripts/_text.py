@@ -0,0 +1,10 @@
+"""
+Text helpers shared by the test scripts' console and JSON reports
+"""
+
+from typing import Optional
+
+
+def short(text: Optional[str], limit: int) -> Optional[str]:
+    """Truncate text to `limit` characters, marking the cut with '...'"""
+    return text if text is None or len(text) <= limit else text[:limit] + "..."
@@ -13,15 +13,10 @@ import random
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
-from app.models.base import Base
-from app.models.user import User
-from app.models.financial_doc import FinancialDoc
-from app.models.news import News
-from app.models.chat_history import ChatHistory
+from app.models import Base, ChatHistory, FinancialDoc, News, User
 from app.core.config import get_settings
-from app.core.security import get_password_hash
 
 settings = get_settings()
 
@@ -33,6 +28,17 @@ SAMPLE_COMPANIES = [
 # Document types
 DOC_TYPES = ["사업보고서", "반기보고서", "분기보고서"]
 
+# Pre-computed bcrypt hashes for the sample passwords ("admin123" / "user123")
+# so init does not pay the KDF cost on every run
+ADMIN_PASSWORD_HASH = os.environ.get(
+    "SAMPLE_ADMIN_HASH",
+    "$2b$12$v8jeQ0g9yi3ilO7oLjK.pOsFfVbynW1tKF2HIs7m6LnWyvGE19oBO"
+)
+USER_PASSWORD_HASH = os.environ.get(
+    "SAMPLE_USER_HASH",
+    "$2b$12$r.B1evIZ70POv7ZMJs/hleHMIu1VsVZhjZnA8wJxsRRR3JF9Ojkzi"
+)
+
 
 def create_database():
     """Create database if it doesn't exist"""
@@ -62,15 +68,22 @@ def init_tables():
     """Initialize all tables"""
     engine = create_engine(settings.DATABASE_URL)
     
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-    print("✅ All tables created")
+    # Create tables only when some are missing (one catalog query on re-runs)
+    missing = set(Base.metadata.tables) - set(inspect(engine).get_table_names())
+    if missing:
+        Base.metadata.create_all(bind=engine)
+        print("✅ All tables created")
+    else:
+        print("ℹ️  All tables already exist")
     
     return engine
 
 
 def create_sample_data(engine):
     """Create sample data for testing"""
+    # numpy is only needed here; keep it off the import path of the other steps
+    import numpy as np
+    
     Session = sessionmaker(bind=engine)
     session = Session()
     
@@ -86,13 +99,13 @@ def create_sample_data(engine):
             User(
                 email="admin@example.com",
                 name="관리자",
-                password_hash=get_password_hash("admin123"),
+                password_hash=ADMIN_PASSWORD_HASH,
                 is_active=True
             ),
             User(
                 email="user@example.com",
                 name="일반사용자",
-                password_hash=get_password_hash("user123"),
+                password_hash=USER_PASSWORD_HASH,
                 is_active=True
             )
         ]
@@ -102,9 +115,21 @@ def create_sample_data(engine):
         
         # 2. Create sample financial documents
         print("Creating sample financial documents...")
+        rng = np.random.default_rng()
+        years = [2023, 2024]
+        quarters = [1, 2]
+        quarterly_types = len(DOC_TYPES) - 1
+        annual_sizes = iter(rng.integers(
+            1000000, 10000001, size=len(SAMPLE_COMPANIES) * len(years)
+        ).tolist())  # 1-10MB
+        quarterly_sizes = iter(rng.integers(
+            500000, 5000001,
+            size=len(SAMPLE_COMPANIES) * len(years) * quarterly_types * len(quarters)
+        ).tolist())  # 0.5-5MB
+        
         docs = []
         for company in SAMPLE_COMPANIES:  # All companies
-            for year in [2023, 2024]:
+            for year in years:
                 for doc_type in DOC_TYPES:
                     if doc_type == "사업보고서":
                         # Annual report - no quarter
@@ -113,19 +138,19 @@ def create_sample_data(engine):
                             doc_type=doc_type,
                             year=year,
                             file_path=f"data/financial_docs/{company}/{year}/{company}_{doc_type}_{year}.pdf",
-                            file_size=random.randint(1000000, 10000000)  # 1-10MB
+                            file_size=next(annual_sizes)
                         )
                         docs.append(doc)
                     else:
                         # Quarterly reports
-                        for quarter in [1, 2]:
+                        for quarter in quarters:
                             doc = FinancialDoc(
                                 company_name=company,
                                 doc_type=doc_type,
                                 year=year,
                                 quarter=quarter,
                                 file_path=f"data/financial_docs/{company}/{year}/{company}_{doc_type}_{year}_Q{quarter}.pdf",
-                                file_size=random.randint(500000, 5000000)  # 0.5-5MB
+                                file_size=next(quarterly_sizes)
                             )
                             docs.append(doc)
         
@@ -144,16 +169,22 @@ def create_sample_data(engine):
             "{company}, 기술 혁신으로 시장 선도"
         ]
         
+        news_per_company = 10
+        days_ago_list = iter(rng.integers(
+            1, 31, size=len(SAMPLE_COMPANIES) * news_per_company
+        ).tolist())
+        now = datetime.now()
+        
         for company in SAMPLE_COMPANIES:
-            for i in range(10):  # 10 news per company
-                days_ago = random.randint(1, 30)
+            for i in range(news_per_company):
+                days_ago = next(days_ago_list)
                 news = News(
                     company_name=company,
                     title=random.choice(news_titles).format(company=company),
                     content=f"{company}의 최근 소식입니다. 상세 내용은 다음과 같습니다...",
                     content_url=f"https://news.example.com/{company}/{i}",
                     source=random.choice(["한국경제", "매일경제", "조선일보", "연합뉴스"]),
-                    published_date=datetime.now() - timedelta(days=days_ago)
+                    published_date=now - timedelta(days=days_ago)
                 )
                 news_items.append(news)
         
@@ -202,12 +233,23 @@ def create_directory_structure():
     """Create directory structure for sample companies"""
     print("\nCreating directory structure...")
     
-    for company in SAMPLE_COMPANIES:
-        for year in [2023, 2024]:
-            dir_path = Path(f"data/financial_docs/{company}/{year}")
-            dir_path.mkdir(parents=True, exist_ok=True)
+    base_path = Path("data/financial_docs")
+    
+    # Only touch directories that are not there yet; re-runs become a
+    # single stat per leaf instead of a stat + mkdir chain
+    missing_dirs = [
+        base_path / company / str(year)
+        for company in SAMPLE_COMPANIES
+        for year in [2023, 2024]
+        if not (base_path / company / str(year)).is_dir()
+    ]
+    for dir_path in missing_dirs:
+        dir_path.mkdir(parents=True, exist_ok=True)
     
-    print("✅ Directory structure created")
+    if missing_dirs:
+        print(f"✅ Directory structure created ({len(missing_dirs)} new)")
+    else:
+        print("ℹ️  Directory structure already exists")
 
 
 def main():
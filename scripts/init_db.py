@@ -11,12 +11,9 @@ import logging
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from sqlalchemy import create_engine
-from app.db.session import Base, engine
-from app.models.financial_doc import FinancialDoc
-from app.models.chat_history import ChatHistory
-from app.models.portfolio_company import PortfolioCompany
-from app.models.news_article import NewsArticle
+from sqlalchemy import inspect
+from app.db.session import Base as SessionBase, engine
+from app.models import Base, FinancialDoc, PortfolioCompany
 from app.core.config import settings
 
 logging.basicConfig(level=logging.INFO)
@@ -32,10 +29,20 @@ def init_database():
         
         logger.info(f"Creating database at: {settings.DATABASE_URL}")
         
-        # Create all tables
-        Base.metadata.create_all(bind=engine)
+        # Models are split across two declarative bases (PortfolioCompany uses
+        # the one in app.db.session); create whatever is missing from either,
+        # with one catalog query on re-runs
+        existing_tables = set(inspect(engine).get_table_names())
+        created = False
+        for metadata in (Base.metadata, SessionBase.metadata):
+            if set(metadata.tables) - existing_tables:
+                metadata.create_all(bind=engine)
+                created = True
         
-        logger.info("Database tables created successfully!")
+        if created:
+            logger.info("Database tables created successfully!")
+        else:
+            logger.info("Database tables already exist")
         
         # Add sample portfolio companies
         from sqlalchemy.orm import Session
@@ -73,19 +80,22 @@ def init_database():
             docs_path = Path("data/financial_docs")
             if docs_path.exists():
                 added_docs = 0
-                for company_dir in docs_path.iterdir():
-                    if company_dir.is_dir():
-                        company_name = company_dir.name
+                for company_entry in os.scandir(docs_path):
+                    if company_entry.is_dir():
+                        company_name = company_entry.name
                         
-                        for pdf_file in company_dir.glob("*.pdf"):
+                        for pdf_entry in os.scandir(company_entry.path):
+                            if not (pdf_entry.name.endswith(".pdf") and pdf_entry.is_file()):
+                                continue
+                            
                             # Check if document already exists
                             existing_doc = session.query(FinancialDoc).filter_by(
-                                file_path=str(pdf_file)
+                                file_path=pdf_entry.path
                             ).first()
                             
                             if not existing_doc:
                                 # Parse filename to extract year and doc type
-                                filename = pdf_file.stem
+                                filename = os.path.splitext(pdf_entry.name)[0]
                                 parts = filename.split("_")
                                 
                                 if len(parts) >= 3:
@@ -100,8 +110,8 @@ def init_database():
                                     company_name=company_name,
                                     year=year,
                                     doc_type=doc_type,
-                                    file_path=str(pdf_file),
-                                    file_size=pdf_file.stat().st_size
+                                    file_path=pdf_entry.path,
+                                    file_size=pdf_entry.stat().st_size
                                 )
                                 session.add(doc)
                                 added_docs += 1
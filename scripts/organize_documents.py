@@ -7,34 +7,40 @@
 
 import os
 import sys
+import argparse
 import re
 import shutil
 from pathlib import Path
 from datetime import datetime
 import hashlib
+import logging
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 from app.models.financial_doc import FinancialDoc
 
 # SQLite를 사용한 간단한 설정
 DATABASE_URL = "sqlite:///./portfolio_qa.db"
 
+logger = logging.getLogger(__name__)
+
 
 class DocumentOrganizer:
     """문서 파일 정리 및 분석 클래스"""
     
     def __init__(self):
         self.base_path = Path("data/financial_docs")
+        self.project_root = Path.cwd()
         self.engine = create_engine(DATABASE_URL)
         self.Session = sessionmaker(bind=self.engine)
         
-        # 테이블 생성 (없을 경우)
+        # 테이블 생성 (없는 테이블이 있을 때만)
         from app.models.base import Base
-        Base.metadata.create_all(bind=self.engine)
+        if set(Base.metadata.tables) - set(inspect(self.engine).get_table_names()):
+            Base.metadata.create_all(bind=self.engine)
         
         # 문서 타입 매핑
         self.doc_type_patterns = {
@@ -124,90 +130,91 @@ class DocumentOrganizer:
         """특정 회사의 문서들 처리"""
         company_path = self.base_path / company_name
         if not company_path.exists():
-            print(f"⚠️  {company_name} 폴더가 없습니다.")
+            logger.warning(f"⚠️  {company_name} 폴더가 없습니다.")
             return
         
-        print(f"\n📁 {company_name} 문서 처리 중...")
+        logger.info(f"\n📁 {company_name} 문서 처리 중...")
         processed = 0
+        added = 0
         
         session = self.Session()
         
         try:
-            # 모든 PDF 파일 찾기
-            for year_dir in company_path.iterdir():
-                if not year_dir.is_dir():
-                    continue
-                    
-                year = year_dir.name
+            # 모든 PDF 파일 찾기 ({회사}/{연도}/*.pdf)
+            for file_path in company_path.glob("*/*.[pP][dD][fF]"):
+                year = file_path.parent.name
                 
-                for file_path in year_dir.glob("*.[pP][dD][fF]"):
-                    print(f"\n  파일: {file_path.name}")
-                    
-                    # 파일명 분석
-                    metadata = self.analyze_filename(file_path.name)
-                    
-                    # 연도가 파일명에서 추출되지 않으면 폴더명 사용
-                    if not metadata["year"]:
-                        try:
-                            metadata["year"] = int(year)
-                        except ValueError:
-                            print(f"    ⚠️  연도를 확인할 수 없습니다: {year}")
-                            continue
-                    
-                    print(f"    분석 결과: 연도={metadata['year']}, "
-                          f"타입={metadata['doc_type']}, 분기={metadata['quarter']}")
-                    
-                    # 새 파일명 생성
-                    new_filename = self.generate_new_filename(company_name, metadata)
-                    new_path = file_path.parent / new_filename
-                    
-                    # 파일명 변경 (필요한 경우)
-                    if file_path.name != new_filename:
-                        if new_path.exists():
-                            print(f"    ⚠️  대상 파일이 이미 존재합니다: {new_filename}")
-                        else:
-                            shutil.move(str(file_path), str(new_path))
-                            print(f"    ✅ 파일명 변경: {file_path.name} → {new_filename}")
-                            file_path = new_path
+                logger.debug(f"\n  파일: {file_path.name}")
+                
+                # 파일명 분석
+                metadata = self.analyze_filename(file_path.name)
+                
+                # 연도가 파일명에서 추출되지 않으면 폴더명 사용
+                if not metadata["year"]:
+                    try:
+                        metadata["year"] = int(year)
+                    except ValueError:
+                        logger.warning(f"    ⚠️  연도를 확인할 수 없습니다: {file_path}")
+                        continue
+                
+                logger.debug(f"    분석 결과: 연도={metadata['year']}, "
+                             f"타입={metadata['doc_type']}, 분기={metadata['quarter']}")
+                
+                # 새 파일명 생성
+                new_filename = self.generate_new_filename(company_name, metadata)
+                new_path = file_path.parent / new_filename
+                
+                # 파일명 변경 (필요한 경우)
+                if file_path.name != new_filename:
+                    if new_path.exists():
+                        logger.warning(f"    ⚠️  대상 파일이 이미 존재합니다: {new_filename}")
+                    else:
+                        shutil.move(str(file_path), str(new_path))
+                        logger.debug(f"    ✅ 파일명 변경: {file_path.name} → {new_filename}")
+                        file_path = new_path
+                
+                # DB에 저장
+                existing = session.query(FinancialDoc).filter_by(
+                    company_name=company_name,
+                    year=metadata["year"],
+                    doc_type=metadata["doc_type"],
+                    quarter=metadata["quarter"]
+                ).first()
+                
+                if existing:
+                    logger.debug(f"    ℹ️  이미 DB에 등록되어 있습니다.")
+                else:
+                    # 파일 정보 수집
+                    file_size = file_path.stat().st_size
+                    file_hash = self.calculate_file_hash(file_path)
+                    # 프로젝트 루트 기준 상대 경로
+                    try:
+                        relative_path = file_path.relative_to(self.project_root)
+                    except ValueError:
+                        relative_path = file_path
                     
-                    # DB에 저장
-                    existing = session.query(FinancialDoc).filter_by(
+                    doc = FinancialDoc(
                         company_name=company_name,
+                        doc_type=metadata["doc_type"] or "기타문서",
                         year=metadata["year"],
-                        doc_type=metadata["doc_type"],
-                        quarter=metadata["quarter"]
-                    ).first()
+                        quarter=metadata["quarter"],
+                        file_path=str(relative_path),
+                        file_size=file_size,
+                        # file_hash=file_hash  # 모델에 추가 필요시
+                    )
                     
-                    if existing:
-                        print(f"    ℹ️  이미 DB에 등록되어 있습니다.")
-                    else:
-                        # 파일 정보 수집
-                        file_size = file_path.stat().st_size
-                        file_hash = self.calculate_file_hash(file_path)
-                        # 프로젝트 루트 기준 상대 경로
-                        relative_path = str(file_path).replace(str(Path.cwd()) + "/", "")
-                        
-                        doc = FinancialDoc(
-                            company_name=company_name,
-                            doc_type=metadata["doc_type"] or "기타문서",
-                            year=metadata["year"],
-                            quarter=metadata["quarter"],
-                            file_path=str(relative_path),
-                            file_size=file_size,
-                            # file_hash=file_hash  # 모델에 추가 필요시
-                        )
-                        
-                        session.add(doc)
-                        print(f"    ✅ DB에 등록되었습니다.")
-                    
-                    processed += 1
-            
+                    session.add(doc)
+                    added += 1
+                    logger.debug(f"    ✅ DB에 등록되었습니다.")
+                
+                processed += 1
+        
             session.commit()
-            print(f"\n✅ {company_name}: {processed}개 파일 처리 완료")
+            logger.info(f"✅ {company_name}: {processed}개 파일 처리 완료, {added}개 DB 등록")
             
         except Exception as e:
             session.rollback()
-            print(f"\n❌ 오류 발생: {e}")
+            logger.error(f"\n❌ 오류 발생: {e}")
             raise
         finally:
             session.close()
@@ -218,19 +225,28 @@ class DocumentOrganizer:
         excel_dir.mkdir(exist_ok=True)
         
         moved = 0
-        for company_path in self.base_path.iterdir():
-            if not company_path.is_dir():
+        created_dirs = set()
+        for excel_file in self.base_path.rglob("*.xlsx"):
+            parts = excel_file.relative_to(self.base_path).parts
+            if len(parts) < 2:  # 회사 폴더 밖의 파일은 건너뜀
                 continue
-                
-            for excel_file in company_path.rglob("*.xlsx"):
-                target = excel_dir / company_path.name / excel_file.parent.name / excel_file.name
+            
+            company_name = parts[0]
+            target = excel_dir / company_name / excel_file.parent.name / excel_file.name
+            if target.parent not in created_dirs:
                 target.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(target.parent)
+            
+            # 같은 파일시스템이면 rename 한 번으로 끝내고, 아니면 복사 후 삭제
+            try:
+                os.replace(excel_file, target)
+            except OSError:
                 shutil.move(str(excel_file), str(target))
-                print(f"  📊 엑셀 파일 이동: {excel_file} → {target}")
-                moved += 1
+            logger.debug(f"  📊 엑셀 파일 이동: {excel_file} → {target}")
+            moved += 1
         
         if moved > 0:
-            print(f"\n✅ {moved}개 엑셀 파일을 별도 폴더로 이동했습니다.")
+            logger.info(f"✅ {moved}개 엑셀 파일을 별도 폴더로 이동했습니다.")
     
     def run(self):
         """전체 문서 정리 프로세스 실행"""
@@ -252,6 +268,17 @@ class DocumentOrganizer:
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="Organize financial documents")
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level (DEBUG shows per-file details)"
+    )
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=args.log_level, format="%(message)s")
+    
     organizer = DocumentOrganizer()
     organizer.run()
 
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """
 Seed database with sample data for development and testing
+
+Rows are written through bulk executemany calls; on PostgreSQL + psycopg2
+the shared engine (app.db.session) batches these into multi-row INSERTs.
 """
 
 import asyncio
 import sys
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, timedelta
 import random
@@ -12,22 +16,31 @@ import random
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, engine
 from app.models.financial_doc import FinancialDoc
 from app.models.news import News
 from app.models.portfolio_company import PortfolioCompany
 from app.models.chat_history import ChatHistory
-from sqlalchemy import select
-import os
+from sqlalchemy import exists, func, insert, select
 from loguru import logger
 
+from _pdf_files import iter_company_pdfs
+
+# (filename keyword, doc_type) checked in order; anything else is 재무제표
+DOC_TYPE_KEYWORDS = (
+    ("사업보고서", "사업보고서"),
+    ("반기보고서", "반기보고서"),
+    ("분기보고서", "분기보고서"),
+)
+DEFAULT_DOC_TYPE = "재무제표"
+
+# Rows per bulk INSERT when streaming financial documents
+INSERT_BATCH_SIZE = 5000
 
-def get_file_size(file_path: str) -> int:
-    """Get file size in bytes"""
-    try:
-        return os.path.getsize(file_path)
-    except:
-        return 0
+
+def has_rows(db, model) -> bool:
+    """Check whether a table has any row with a single EXISTS probe"""
+    return db.execute(select(exists().select_from(model))).scalar()
 
 
 def seed_portfolio_companies():
@@ -56,76 +69,68 @@ def seed_portfolio_companies():
     db = SessionLocal()
     try:
         # Check if companies already exist
-        existing = db.query(PortfolioCompany).all()
-        if existing:
-            logger.info(f"Portfolio companies already exist: {len(existing)}")
+        if has_rows(db, PortfolioCompany):
+            logger.info("Portfolio companies already exist, skipping")
             return
         
         # Add companies
-        for company_data in companies:
-            company = PortfolioCompany(**company_data)
-            db.add(company)
-        
+        db.bulk_insert_mappings(PortfolioCompany, companies)
         db.commit()
         logger.info(f"Added {len(companies)} portfolio companies")
         
     except Exception as e:
         logger.error(f"Error seeding portfolio companies: {e}")
         db.rollback()
+        raise
     finally:
         db.close()
 
 
+def iter_financial_doc_rows(base_path: Path):
+    """Yield FinancialDoc insert mappings for every PDF under base_path"""
+    for company_name, year, pdf_entry in iter_company_pdfs(base_path):
+        # Determine document type from filename
+        doc_type = next(
+            (dt for keyword, dt in DOC_TYPE_KEYWORDS if keyword in pdf_entry.name),
+            DEFAULT_DOC_TYPE
+        )
+        
+        yield {
+            "company_name": company_name,
+            "doc_type": doc_type,
+            "year": int(year),
+            "file_path": pdf_entry.path,
+            "file_size": pdf_entry.stat().st_size
+        }
+
+
 def seed_financial_documents():
     """Seed financial documents based on actual files"""
     db = SessionLocal()
     
     try:
         # Check if documents already exist
-        existing_count = db.query(FinancialDoc).count()
-        if existing_count > 0:
-            logger.info(f"Financial documents already exist: {existing_count}")
+        if has_rows(db, FinancialDoc):
+            logger.info("Financial documents already exist, skipping")
             return
         
         # Base path for documents
         base_path = Path("data/financial_docs")
         
-        # Find all PDF files
-        documents = []
-        for company_dir in base_path.iterdir():
-            if company_dir.is_dir():
-                company_name = company_dir.name
-                for year_dir in company_dir.iterdir():
-                    if year_dir.is_dir():
-                        year = year_dir.name
-                        for pdf_file in year_dir.glob("*.pdf"):
-                            # Determine document type from filename
-                            doc_type = "재무제표"
-                            if "사업보고서" in pdf_file.name:
-                                doc_type = "사업보고서"
-                            elif "반기보고서" in pdf_file.name:
-                                doc_type = "반기보고서"
-                            
-                            doc = FinancialDoc(
-                                company_name=company_name,
-                                doc_type=doc_type,
-                                year=int(year),
-                                file_path=str(pdf_file),
-                                file_size=get_file_size(pdf_file)
-                            )
-                            documents.append(doc)
-                            db.add(doc)
+        # Stream PDF files into the table in fixed-size batches
+        rows = iter_financial_doc_rows(base_path)
+        added = 0
+        while batch := list(islice(rows, INSERT_BATCH_SIZE)):
+            db.bulk_insert_mappings(FinancialDoc, batch)
+            added += len(batch)
         
         db.commit()
-        logger.info(f"Added {len(documents)} financial documents")
-        
-        # Log details
-        for doc in documents:
-            logger.debug(f"  - {doc.company_name} {doc.year} {doc.doc_type}: {doc.file_path}")
+        logger.info(f"Added {added} financial documents")
         
     except Exception as e:
         logger.error(f"Error seeding financial documents: {e}")
         db.rollback()
+        raise
     finally:
         db.close()
 
@@ -136,12 +141,12 @@ def seed_news_articles():
     
     try:
         # Check if news already exist
-        existing_count = db.query(News).count()
-        if existing_count > 0:
-            logger.info(f"News articles already exist: {existing_count}")
+        if has_rows(db, News):
+            logger.info("News articles already exist, skipping")
             return
         
-        # Sample news data
+        # Sample news data (dates relative to a single clock read)
+        now = datetime.now()
         news_templates = [
             # 마인이스 뉴스
             {
@@ -149,21 +154,21 @@ def seed_news_articles():
                 "title": "마인이스, AI 빅데이터 플랫폼 2.0 출시",
                 "content": "마인이스가 차세대 AI 빅데이터 분석 플랫폼 2.0을 출시했다. 이번 플랫폼은 실시간 데이터 처리 속도를 기존 대비 3배 향상시켰으며, 자연어 처리 기능을 대폭 강화했다.",
                 "source": "테크뉴스",
-                "published_date": datetime.now() - timedelta(days=5)
+                "published_date": now - timedelta(days=5)
             },
             {
                 "company_name": "마인이스",
                 "title": "마인이스, 글로벌 AI 기업과 전략적 파트너십 체결",
                 "content": "마인이스가 글로벌 AI 선도 기업과 전략적 파트너십을 체결했다. 이번 협력을 통해 양사는 AI 기술 공동 개발 및 해외 시장 진출을 가속화할 예정이다.",
                 "source": "비즈니스타임즈",
-                "published_date": datetime.now() - timedelta(days=15)
+                "published_date": now - timedelta(days=15)
             },
             {
                 "company_name": "마인이스",
                 "title": "마인이스, 2024년 매출 30% 성장 전망",
                 "content": "마인이스가 2024년 매출 목표를 전년 대비 30% 성장으로 설정했다. 신규 고객 확보와 기존 제품 업그레이드를 통해 시장 점유율을 확대할 계획이다.",
                 "source": "경제일보",
-                "published_date": datetime.now() - timedelta(days=30)
+                "published_date": now - timedelta(days=30)
             },
             
             # 설로인 뉴스
@@ -172,21 +177,21 @@ def seed_news_articles():
                 "title": "설로인, 프리미엄 한우 레스토랑 10호점 오픈",
                 "content": "프리미엄 한우 전문 기업 설로인이 강남구에 10호점을 오픈했다. 이번 매장은 플래그십 스토어로 와인 셀러와 프라이빗 다이닝룸을 갖추고 있다.",
                 "source": "식품저널",
-                "published_date": datetime.now() - timedelta(days=7)
+                "published_date": now - timedelta(days=7)
             },
             {
                 "company_name": "설로인",
                 "title": "설로인, 온라인 정육 플랫폼 '설로인몰' 런칭",
                 "content": "설로인이 프리미엄 한우를 온라인으로 구매할 수 있는 '설로인몰'을 런칭했다. 당일 도축한 신선한 한우를 익일 배송하는 서비스를 제공한다.",
                 "source": "유통신문",
-                "published_date": datetime.now() - timedelta(days=20)
+                "published_date": now - timedelta(days=20)
             },
             {
                 "company_name": "설로인",
                 "title": "설로인, ESG 경영 우수기업 선정",
                 "content": "설로인이 축산업계 ESG 경영 우수기업으로 선정됐다. 친환경 사육 시스템과 지역 농가와의 상생 협력이 높은 평가를 받았다.",
                 "source": "ESG경제",
-                "published_date": datetime.now() - timedelta(days=45)
+                "published_date": now - timedelta(days=45)
             },
             
             # 우나스텔라 뉴스
@@ -195,35 +200,33 @@ def seed_news_articles():
                 "title": "우나스텔라, 원격진료 플랫폼 이용자 100만 돌파",
                 "content": "디지털 헬스케어 기업 우나스텔라의 원격진료 플랫폼 이용자가 100만 명을 돌파했다. 코로나19 이후 비대면 의료 서비스 수요가 급증하며 빠른 성장세를 보이고 있다.",
                 "source": "헬스조선",
-                "published_date": datetime.now() - timedelta(days=3)
+                "published_date": now - timedelta(days=3)
             },
             {
                 "company_name": "우나스텔라",
                 "title": "우나스텔라, AI 진단 보조 시스템 FDA 승인",
                 "content": "우나스텔라가 개발한 AI 기반 진단 보조 시스템이 미국 FDA 승인을 받았다. 이 시스템은 의료 영상을 분석해 질병을 조기에 발견하는 데 도움을 준다.",
                 "source": "메디컬투데이",
-                "published_date": datetime.now() - timedelta(days=10)
+                "published_date": now - timedelta(days=10)
             },
             {
                 "company_name": "우나스텔라",
                 "title": "우나스텔라, 대형 병원과 디지털 헬스케어 MOU 체결",
                 "content": "우나스텔라가 국내 대형 병원들과 디지털 헬스케어 협력을 위한 MOU를 체결했다. 이번 협약을 통해 병원의 디지털 전환을 지원할 예정이다.",
                 "source": "의료신문",
-                "published_date": datetime.now() - timedelta(days=25)
+                "published_date": now - timedelta(days=25)
             }
         ]
         
         # Add news articles
-        for news_data in news_templates:
-            news = News(**news_data)
-            db.add(news)
-        
+        db.bulk_insert_mappings(News, news_templates)
         db.commit()
         logger.info(f"Added {len(news_templates)} news articles")
         
     except Exception as e:
         logger.error(f"Error seeding news articles: {e}")
         db.rollback()
+        raise
     finally:
         db.close()
 
@@ -234,9 +237,8 @@ def seed_sample_chat_history():
     
     try:
         # Check if chat history already exists
-        existing_count = db.query(ChatHistory).count()
-        if existing_count > 0:
-            logger.info(f"Chat history already exists: {existing_count}")
+        if has_rows(db, ChatHistory):
+            logger.info("Chat history already exists, skipping")
             return
         
         # Sample chat history
@@ -258,50 +260,62 @@ def seed_sample_chat_history():
             }
         ]
         
-        # Add chat history
-        for i, chat_data in enumerate(chats):
-            chat = ChatHistory(
-                **chat_data,
-                created_at=datetime.now() - timedelta(hours=i*2)
-            )
-            db.add(chat)
-        
+        # Add chat history (one Core executemany INSERT, 2h apart)
+        now = datetime.now()
+        db.execute(
+            insert(ChatHistory),
+            [
+                {**chat_data, "created_at": now - timedelta(hours=i*2)}
+                for i, chat_data in enumerate(chats)
+            ]
+        )
         db.commit()
         logger.info(f"Added {len(chats)} chat history entries")
         
     except Exception as e:
         logger.error(f"Error seeding chat history: {e}")
         db.rollback()
+        raise
     finally:
         db.close()
 
 
-def main():
+async def main():
     """Main function to seed all data"""
     logger.info("Starting database seeding...")
     
-    # Seed data in order
-    logger.info("1. Seeding portfolio companies...")
-    seed_portfolio_companies()
-    
-    logger.info("2. Seeding financial documents...")
-    seed_financial_documents()
-    
-    logger.info("3. Seeding news articles...")
-    seed_news_articles()
+    seed_steps = [
+        ("portfolio companies", seed_portfolio_companies),
+        ("financial documents", seed_financial_documents),
+        ("news articles", seed_news_articles),
+        ("sample chat history", seed_sample_chat_history),
+    ]
     
-    logger.info("4. Seeding sample chat history...")
-    seed_sample_chat_history()
+    if engine.dialect.name == "sqlite":
+        # SQLite allows one writer at a time and fails concurrent writers
+        # with "database is locked", so seed in order
+        for i, (name, seed) in enumerate(seed_steps, 1):
+            logger.info(f"{i}. Seeding {name}...")
+            seed()
+    else:
+        # The four tables are independent, so seed them concurrently; each
+        # seed function opens its own session (and connection) in its thread
+        # and re-raises on failure, which fails the gather
+        logger.info("Seeding portfolio companies, financial documents, news articles and chat history...")
+        await asyncio.gather(*(asyncio.to_thread(seed) for _, seed in seed_steps))
     
     logger.info("Database seeding completed!")
     
     # Show summary
     db = SessionLocal()
     try:
-        doc_count = db.query(FinancialDoc).count()
-        news_count = db.query(News).count()
-        chat_count = db.query(ChatHistory).count()
-        company_count = db.query(PortfolioCompany).count()
+        # All four counts in one round-trip via scalar subqueries
+        company_count, doc_count, news_count, chat_count = db.execute(
+            select(*(
+                select(func.count()).select_from(model).scalar_subquery()
+                for model in (PortfolioCompany, FinancialDoc, News, ChatHistory)
+            ))
+        ).one()
         
         print("\n=== Seeding Summary ===")
         print(f"Portfolio companies: {company_count}")
@@ -314,4 +328,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -15,21 +15,25 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from app.core.config import settings
 
+# Storage roots, resolved once
+DATA_PATH = Path(settings.DATA_PATH)
+FINANCIAL_DOCS_PATH = Path(settings.FINANCIAL_DOCS_PATH)
+CACHE_PATH = Path(settings.CACHE_PATH)
+
 
 def create_file_structure():
     """Create the required directory structure for document storage"""
     
-    base_path = Path(settings.DATA_PATH)
-    financial_docs_path = Path(settings.FINANCIAL_DOCS_PATH)
-    cache_path = Path(settings.CACHE_PATH)
+    base_path = DATA_PATH
+    financial_docs_path = FINANCIAL_DOCS_PATH
+    cache_path = CACHE_PATH
     
-    # Create main directories
-    directories = [
+    # Only leaf directories are listed; mkdir(parents=True) creates the
+    # intermediate ones (base, company) on the way
+    directories = {
         base_path,
-        financial_docs_path,
-        cache_path,
         cache_path / "embeddings"
-    ]
+    }
     
     # Create sample company directories
     sample_companies = [
@@ -38,23 +42,20 @@ def create_file_structure():
     ]
     
     for company in sample_companies:
-        company_path = financial_docs_path / company
-        directories.append(company_path)
-        
         # Create year directories (2022-2024)
         for year in range(2022, 2025):
-            year_path = company_path / str(year)
-            directories.append(year_path)
+            directories.add(financial_docs_path / company / str(year))
     
-    # Create all directories
+    # Create all directories (one mkdir per leaf, no separate exists() probe)
     created_count = 0
-    for directory in directories:
-        if not directory.exists():
-            directory.mkdir(parents=True, exist_ok=True)
+    for directory in sorted(directories):
+        try:
+            directory.mkdir(parents=True)
+        except FileExistsError:
+            logger.info(f"Directory already exists: {directory}")
+        else:
             logger.info(f"Created directory: {directory}")
             created_count += 1
-        else:
-            logger.info(f"Directory already exists: {directory}")
     
     # Create metadata file
     metadata_file = base_path / "metadata.json"
@@ -83,8 +84,6 @@ def create_file_structure():
 def create_sample_documents():
     """Create sample PDF placeholder files for testing"""
     
-    financial_docs_path = Path(settings.FINANCIAL_DOCS_PATH)
-    
     # Sample document templates
     doc_templates = [
         {"type": "사업보고서", "filename": "annual_report_{year}.pdf"},
@@ -98,17 +97,19 @@ def create_sample_documents():
     
     for company in sample_companies:
         for year in [2023, 2024]:
+            company_year_dir = FINANCIAL_DOCS_PATH / company / str(year)
+            
             for template in doc_templates:
                 # Skip quarters for 2024 if it's early in the year
                 if year == 2024 and template["type"] not in ["사업보고서", "1분기보고서"]:
                     continue
                 
                 filename = template["filename"].format(year=year)
-                file_path = financial_docs_path / company / str(year) / filename
+                file_path = company_year_dir / filename
                 
                 # Create a placeholder text file (in real scenario, these would be PDFs)
                 if not file_path.exists():
-                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    company_year_dir.mkdir(parents=True, exist_ok=True)
                     
                     # Create sample content
                     content = f"""
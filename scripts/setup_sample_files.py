@@ -6,14 +6,14 @@ Creates dummy PDF files or downloads sample files
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import requests
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.utils import simpleSplit
 from reportlab.lib import colors
 
 # Add project root to path
@@ -22,30 +22,64 @@ sys.path.append(str(Path(__file__).parent.parent))
 # Sample companies
 SAMPLE_COMPANIES = ["마인이스", "우나스텔라", "설로인"]
 
+# Output root for generated sample PDFs
+FINANCIAL_DOCS_PATH = Path("data/financial_docs")
+
+# Fixed page layout for the sample reports (drawn directly on the canvas,
+# no platypus flowables / styles to build per file)
+PAGE_WIDTH, PAGE_HEIGHT = letter
+MARGIN = inch
+BODY_FONT = ('Helvetica', 12)  # In production, use Korean font
+BODY_LEADING = 18
+
+# Sample financial data table
+FINANCIAL_TABLE_DATA = [
+    ['항목', '당기', '전기', '증감률'],
+    ['매출액', '80,123', '75,432', '+6.2%'],
+    ['영업이익', '12,345', '11,234', '+9.9%'],
+    ['당기순이익', '9,876', '8,765', '+12.7%'],
+    ['자산총계', '150,000', '140,000', '+7.1%'],
+    ['부채총계', '50,000', '48,000', '+4.2%'],
+    ['자본총계', '100,000', '92,000', '+8.7%']
+]
+TABLE_COL_WIDTHS = [2*inch, 1.5*inch, 1.5*inch, 1*inch]
+TABLE_ROW_HEIGHT = 0.3*inch
+TABLE_X = [MARGIN + sum(TABLE_COL_WIDTHS[:i]) for i in range(len(TABLE_COL_WIDTHS) + 1)]
+
+
+def _draw_financial_table(c, top):
+    """Draw FINANCIAL_TABLE_DATA with its top edge at y=top; returns the bottom y"""
+    rows = len(FINANCIAL_TABLE_DATA)
+    ys = [top - i * TABLE_ROW_HEIGHT for i in range(rows + 1)]
+    
+    # Header / body backgrounds
+    c.setFillColor(colors.grey)
+    c.rect(TABLE_X[0], ys[1], TABLE_X[-1] - TABLE_X[0], TABLE_ROW_HEIGHT, stroke=0, fill=1)
+    c.setFillColor(colors.beige)
+    c.rect(TABLE_X[0], ys[-1], TABLE_X[-1] - TABLE_X[0], ys[1] - ys[-1], stroke=0, fill=1)
+    
+    # Cell text, centered
+    for row_idx, row in enumerate(FINANCIAL_TABLE_DATA):
+        if row_idx == 0:
+            c.setFillColor(colors.whitesmoke)
+            c.setFont('Helvetica-Bold', 12)
+        else:
+            c.setFillColor(colors.black)
+            c.setFont(*BODY_FONT)
+        baseline = ys[row_idx + 1] + 0.1*inch
+        for col_idx, cell in enumerate(row):
+            center = (TABLE_X[col_idx] + TABLE_X[col_idx + 1]) / 2
+            c.drawCentredString(center, baseline, cell)
+    
+    c.setStrokeColor(colors.black)
+    c.grid(TABLE_X, ys)
+    return ys[-1]
+
 
 def create_sample_pdf(filepath, company, doc_type, year, quarter=None):
     """Create a sample PDF with Korean financial report content"""
-    doc = SimpleDocTemplate(str(filepath), pagesize=letter)
-    story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom Korean style
-    korean_style = ParagraphStyle(
-        'Korean',
-        parent=styles['Normal'],
-        fontName='Helvetica',  # In production, use Korean font
-        fontSize=12,
-        leading=18
-    )
-    
-    title_style = ParagraphStyle(
-        'KoreanTitle',
-        parent=styles['Title'],
-        fontName='Helvetica-Bold',
-        fontSize=20,
-        leading=24,
-        alignment=1  # Center
-    )
+    c = canvas.Canvas(str(filepath), pagesize=letter)
+    y = PAGE_HEIGHT - MARGIN
     
     # Title
     if quarter:
@@ -53,71 +87,65 @@ def create_sample_pdf(filepath, company, doc_type, year, quarter=None):
     else:
         title = f"{company} {year}년 {doc_type}"
     
-    story.append(Paragraph(title, title_style))
-    story.append(Spacer(1, 0.5*inch))
+    c.setFont('Helvetica-Bold', 20)
+    c.drawCentredString(PAGE_WIDTH / 2, y, title)
+    y -= 24 + 0.5*inch
     
     # Company info
-    story.append(Paragraph(f"<b>회사명:</b> {company}", korean_style))
-    story.append(Paragraph(f"<b>보고서 유형:</b> {doc_type}", korean_style))
-    story.append(Paragraph(f"<b>회계연도:</b> {year}년", korean_style))
+    info_lines = [
+        f"회사명: {company}",
+        f"보고서 유형: {doc_type}",
+        f"회계연도: {year}년"
+    ]
     if quarter:
-        story.append(Paragraph(f"<b>분기:</b> {quarter}분기", korean_style))
-    story.append(Spacer(1, 0.3*inch))
+        info_lines.append(f"분기: {quarter}분기")
     
-    # Sample financial data table
-    story.append(Paragraph("<b>주요 재무 현황</b>", korean_style))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Create sample financial data
-    data = [
-        ['항목', '당기', '전기', '증감률'],
-        ['매출액', '80,123', '75,432', '+6.2%'],
-        ['영업이익', '12,345', '11,234', '+9.9%'],
-        ['당기순이익', '9,876', '8,765', '+12.7%'],
-        ['자산총계', '150,000', '140,000', '+7.1%'],
-        ['부채총계', '50,000', '48,000', '+4.2%'],
-        ['자본총계', '100,000', '92,000', '+8.7%']
-    ]
+    c.setFont(*BODY_FONT)
+    for line in info_lines:
+        c.drawString(MARGIN, y, line)
+        y -= BODY_LEADING
+    y -= 0.3*inch
     
-    # Create table
-    table = Table(data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1*inch])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
-    
-    story.append(table)
-    story.append(Spacer(1, 0.3*inch))
+    # Sample financial data table
+    c.setFont('Helvetica-Bold', 12)
+    c.drawString(MARGIN, y, "주요 재무 현황")
+    y -= 0.2*inch + BODY_LEADING
+    y = _draw_financial_table(c, y) - 0.3*inch - BODY_LEADING
     
     # Add sample text content
-    story.append(Paragraph("<b>사업 개요</b>", korean_style))
-    story.append(Paragraph(
+    c.setFillColor(colors.black)
+    c.setFont('Helvetica-Bold', 12)
+    c.drawString(MARGIN, y, "사업 개요")
+    y -= BODY_LEADING
+    
+    overview = (
         f"{company}는 대한민국을 대표하는 기업으로, 지속적인 혁신과 성장을 통해 "
         f"글로벌 시장에서 경쟁력을 강화하고 있습니다. {year}년에는 특히 "
         f"신사업 분야에서 괄목할만한 성과를 달성하였으며, ESG 경영을 통해 "
-        f"지속가능한 성장 기반을 마련하였습니다.",
-        korean_style
-    ))
-    story.append(Spacer(1, 0.2*inch))
+        f"지속가능한 성장 기반을 마련하였습니다."
+    )
+    c.setFont(*BODY_FONT)
+    for line in simpleSplit(overview, *BODY_FONT, PAGE_WIDTH - 2 * MARGIN):
+        c.drawString(MARGIN, y, line)
+        y -= BODY_LEADING
     
     # Footer
-    story.append(Spacer(1, 1*inch))
-    story.append(Paragraph(
-        f"본 문서는 테스트용 샘플 문서입니다. 실제 {company}의 {doc_type}가 아닙니다.",
-        ParagraphStyle('Footer', parent=korean_style, fontSize=10, textColor=colors.grey)
-    ))
+    y -= 1.2*inch
+    c.setFillColor(colors.grey)
+    c.setFont('Helvetica', 10)
+    c.drawString(MARGIN, y, f"본 문서는 테스트용 샘플 문서입니다. 실제 {company}의 {doc_type}가 아닙니다.")
     
     # Build PDF
-    doc.build(story)
+    c.showPage()
+    c.save()
     print(f"✅ Created: {filepath}")
 
 
+def _create_sample_pdf_task(task):
+    """Worker entry point for ProcessPoolExecutor (must be top-level to pickle)"""
+    create_sample_pdf(*task)
+
+
 def setup_sample_pdfs():
     """Create sample PDF files for testing"""
     print("📄 Creating sample PDF files...")
@@ -129,19 +157,19 @@ def setup_sample_pdfs():
         print("Installing reportlab for PDF generation...")
         os.system(f"{sys.executable} -m pip install reportlab")
     
-    created_count = 0
-    
+    # Collect the missing files first; directories are created here so
+    # the worker processes never race on mkdir
+    tasks = []
     for company in SAMPLE_COMPANIES:
         for year in [2023, 2024]:
             # Annual report
-            dir_path = Path(f"data/financial_docs/{company}/{year}")
+            dir_path = FINANCIAL_DOCS_PATH / company / str(year)
             dir_path.mkdir(parents=True, exist_ok=True)
             
             # Create annual report
             filepath = dir_path / f"{company}_{year}_사업보고서.pdf"
             if not filepath.exists():
-                create_sample_pdf(filepath, company, "사업보고서", year)
-                created_count += 1
+                tasks.append((filepath, company, "사업보고서", year))
             
             # Create quarterly reports
             for quarter in [1, 2]:
@@ -152,8 +180,13 @@ def setup_sample_pdfs():
                     filename = f"{company}_{year}_Q{quarter}_{doc_type}.pdf"
                     filepath = dir_path / filename
                     if not filepath.exists():
-                        create_sample_pdf(filepath, company, doc_type, year, quarter)
-                        created_count += 1
+                        tasks.append((filepath, company, doc_type, year, quarter))
+    
+    # Each PDF is independent CPU work (layout + compression)
+    if tasks:
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(_create_sample_pdf_task, tasks))
+    created_count = len(tasks)
     
     print(f"\n✅ Created {created_count} sample PDF files")
     print(f"📁 Files location: data/financial_docs/")
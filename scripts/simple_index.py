@@ -11,10 +11,15 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from loguru import logger
+from sqlalchemy import inspect
+
 from app.db.session import SessionLocal, engine
 from app.models.base import Base
 from app.models.financial_doc import FinancialDoc
 
+from _pdf_files import iter_company_pdfs
+
 
 def parse_filename(filename):
     """Parse company name, year, and doc type from filename"""
@@ -33,56 +38,64 @@ def index_documents():
     """Index all PDF documents in the financial_docs directory"""
     financial_docs_path = Path("data/financial_docs")
     
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
+    # Create database tables only when some are missing (one catalog query on re-runs)
+    if set(Base.metadata.tables) - set(inspect(engine).get_table_names()):
+        Base.metadata.create_all(bind=engine)
     
     # Get database session
     db = SessionLocal()
     
     indexed_count = 0
+    removed_count = 0
     error_count = 0
     
     try:
-        # Clear existing entries to avoid duplicates
-        db.query(FinancialDoc).delete()
-        db.commit()
+        # Load current rows keyed by file path so re-runs only write what changed
+        existing = {}
+        for doc in db.query(FinancialDoc):
+            if doc.file_path in existing:
+                db.delete(doc)  # duplicate row from an earlier run
+                removed_count += 1
+            else:
+                existing[doc.file_path] = doc
         
         # Walk through all PDF files
-        for company_dir in financial_docs_path.iterdir():
-            if not company_dir.is_dir():
-                continue
-                
-            company_name = company_dir.name
-            
-            for year_dir in company_dir.iterdir():
-                if not year_dir.is_dir():
+        for company_name, _, pdf_entry in iter_company_pdfs(financial_docs_path):
+            try:
+                # Parse filename
+                file_info = parse_filename(pdf_entry.name)
+                if not file_info:
+                    print(f"⚠️  Could not parse: {pdf_entry.name}")
+                    error_count += 1
                     continue
-                    
-                for pdf_file in year_dir.glob("*.pdf"):
-                    try:
-                        # Parse filename
-                        file_info = parse_filename(pdf_file.name)
-                        if not file_info:
-                            print(f"⚠️  Could not parse: {pdf_file.name}")
-                            error_count += 1
-                            continue
-                        
-                        # Create document record
-                        doc = FinancialDoc(
-                            company_name=file_info['company_name'],
-                            doc_type=file_info['doc_type'],
-                            year=file_info['year'],
-                            file_path=str(pdf_file),
-                            file_size=pdf_file.stat().st_size
-                        )
-                        
-                        db.add(doc)
-                        indexed_count += 1
-                        print(f"✅ Indexed: {company_name} - {file_info['year']} - {file_info['doc_type']}")
-                        
-                    except Exception as e:
-                        print(f"❌ Error indexing {pdf_file}: {e}")
-                        error_count += 1
+                
+                record = {
+                    'company_name': file_info['company_name'],
+                    'doc_type': file_info['doc_type'],
+                    'year': file_info['year'],
+                    'file_size': pdf_entry.stat().st_size
+                }
+                
+                doc = existing.pop(pdf_entry.path, None)
+                if doc is None:
+                    # New document record
+                    db.add(FinancialDoc(file_path=pdf_entry.path, **record))
+                else:
+                    # Existing record; the ORM only emits an UPDATE if a value changed
+                    for key, value in record.items():
+                        setattr(doc, key, value)
+                
+                indexed_count += 1
+                logger.debug(f"✅ Indexed: {company_name} - {file_info['year']} - {file_info['doc_type']}")
+                
+            except Exception as e:
+                print(f"❌ Error indexing {pdf_entry.path}: {e}")
+                error_count += 1
+        
+        # Drop rows whose files are gone (or no longer parse)
+        for doc in existing.values():
+            db.delete(doc)
+            removed_count += 1
         
         db.commit()
         
@@ -94,6 +107,7 @@ def index_documents():
     
     print(f"\n📊 Indexing Summary:")
     print(f"   Total indexed: {indexed_count}")
+    print(f"   Removed: {removed_count}")
     print(f"   Errors: {error_count}")
     
     return indexed_count, error_count
@@ -132,6 +146,10 @@ def verify_indexed():
 
 
 if __name__ == "__main__":
+    # Per-file progress is logged at DEBUG; pass --verbose to see it
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if "--verbose" in sys.argv else "INFO")
+    
     if "--verify" in sys.argv:
         verify_indexed()
     else:
@@ -4,22 +4,75 @@ Test Claude API integration
 """
 
 import asyncio
+import json
+import re
 import sys
 from pathlib import Path
 import argparse
+from contextlib import aclosing
+from functools import lru_cache, partial
 from loguru import logger
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from app.core.llm_client import LLMClient
 from app.core.config import settings
+import _llm_cache
+from _llm_cache import cached_analyze, cached_generate, cache_embeddings
+from _text import short
 
+# Upper bound on in-flight Claude requests per test (provider rate limits)
+MAX_CONCURRENT_REQUESTS = 8
 
-async def test_basic_completion():
+# Model family name expected in the model id for each routing tier
+TIER_TO_MARKER = {
+    "simple": "haiku",
+    "standard": "sonnet",
+    "advanced": "opus",
+}
+
+
+async def gather_limited(coros, limit: int = MAX_CONCURRENT_REQUESTS) -> List:
+    """Run coroutines concurrently (at most `limit` at a time); exceptions are returned, not raised"""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+
+async def verify_streaming(
+    client: LLMClient,
+    prompt: str,
+    question_type: str,
+    expected: str,
+    max_tokens: int = 500
+) -> Tuple[str, bool]:
+    """Stream a completion and stop as soon as `expected` appears in it"""
+    expected = expected.lower()
+    text = ""
+    
+    async with aclosing(client.generate_text_stream(
+        prompt=prompt,
+        question_type=question_type,
+        max_tokens=max_tokens,
+        temperature=0.3
+    )) as chunks:
+        async for chunk in chunks:
+            text += chunk
+            if expected in text.lower():
+                return text, True
+    
+    return text, False
+
+
+async def test_basic_completion(client: Optional[LLMClient] = None):
     """Test basic text completion"""
-    client = LLMClient()
+    client = client or LLMClient()
     
     test_prompts = [
         {
@@ -39,47 +92,67 @@ async def test_basic_completion():
         }
     ]
     
+    for test in test_prompts:
+        logger.info(f"Testing prompt: {short(test['prompt'], 50)}")
+    
+    checks = await gather_limited([
+        _llm_cache.cached_call(
+            "verify_stream",
+            partial(verify_streaming, client, test['prompt'], test['type'], test['expected']),
+            prompt=test['prompt'],
+            question_type=test['type'],
+            expected=test['expected']
+        )
+        for test in test_prompts
+    ])
+    
     results = []
     
-    for test in test_prompts:
-        logger.info(f"Testing prompt: {test['prompt'][:50]}...")
-        
-        try:
-            response = await client.generate_text(
-                prompt=test['prompt'],
-                question_type=test['type'],
-                max_tokens=500,
-                temperature=0.3
-            )
-            
-            success = test['expected'].lower() in response.lower()
-            
-            results.append({
-                "prompt": test['prompt'],
-                "type": test['type'],
-                "response": response[:200] + "..." if len(response) > 200 else response,
-                "success": success,
-                "error": None
-            })
-            
-            logger.info(f"Response received: {'✅' if success else '❌'}")
-            
-        except Exception as e:
+    for test, check in zip(test_prompts, checks):
+        if isinstance(check, Exception):
             results.append({
                 "prompt": test['prompt'],
                 "type": test['type'],
                 "response": None,
                 "success": False,
-                "error": str(e)
+                "error": str(check)
             })
-            logger.error(f"Error: {str(e)}")
+            logger.error(f"Error: {str(check)}")
+            continue
+        
+        response, success = check
+        
+        results.append({
+            "prompt": test['prompt'],
+            "type": test['type'],
+            "response": short(response, 200),
+            "success": success,
+            "error": None
+        })
+        
+        logger.info(f"Response received: {'✅' if success else '❌'}")
     
     return results
 
 
-async def test_document_analysis():
+def _parse_json_answers(text: str, count: int) -> List[str]:
+    """Extract a JSON array of `count` answers, tolerating prose around it"""
+    try:
+        answers = json.loads(text)
+    except json.JSONDecodeError:
+        match = re.search(r"\[.*\]", text, re.DOTALL)
+        if not match:
+            raise ValueError("No JSON array found in batched response")
+        answers = json.loads(match.group(0))
+    
+    if not isinstance(answers, list) or len(answers) != count:
+        raise ValueError(f"Expected {count} answers, got: {answers!r:.100}")
+    return [str(answer) for answer in answers]
+
+
+async def test_document_analysis(client: Optional[LLMClient] = None, batch: bool = True):
     """Test document analysis capability"""
-    client = LLMClient()
+    client = client or LLMClient()
     
     # Sample financial document content
     sample_doc = """
@@ -106,42 +179,68 @@ async def test_document_analysis():
         "전년 대비 매출 성장률은 몇 퍼센트인가요?"
     ]
     
-    results = []
-    
     for question in test_questions:
         logger.info(f"Testing document analysis: {question}")
-        
+    
+    if batch:
+        # One request for all questions: the document is sent (and billed) once
+        numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(test_questions, 1))
+        prompt = (
+            f"Document:\n{sample_doc}\n\n"
+            f"Answer each question based on the document above. Respond with only a JSON array "
+            f"of {len(test_questions)} answer strings, in question order.\n"
+            f"Questions:\n{numbered}"
+        )
         try:
-            result = await client.analyze_document(
+            response = await cached_generate(
+                client,
+                prompt=prompt,
+                question_type="standard",
+                max_tokens=1500,
+                temperature=0.3
+            )
+            analyses = [{"answer": answer} for answer in _parse_json_answers(response, len(test_questions))]
+        except Exception as e:
+            analyses = [e] * len(test_questions)
+    else:
+        analyses = await gather_limited([
+            cached_analyze(
+                client,
                 document_content=sample_doc,
                 question=question,
                 doc_type="financial_report"
             )
-            
-            results.append({
-                "question": question,
-                "answer": result['answer'],
-                "success": True,
-                "error": None
-            })
-            
-            logger.info("Analysis completed successfully")
-            
-        except Exception as e:
+            for question in test_questions
+        ])
+    
+    results = []
+    
+    for question, result in zip(test_questions, analyses):
+        if isinstance(result, Exception):
             results.append({
                 "question": question,
                 "answer": None,
                 "success": False,
-                "error": str(e)
+                "error": str(result)
             })
-            logger.error(f"Error: {str(e)}")
+            logger.error(f"Error: {str(result)}")
+            continue
+        
+        results.append({
+            "question": question,
+            "answer": result['answer'],
+            "success": True,
+            "error": None
+        })
+        
+        logger.info("Analysis completed successfully")
     
     return results
 
 
-async def test_model_routing():
+async def test_model_routing(client: Optional[LLMClient] = None):
     """Test model routing logic"""
-    client = LLMClient()
+    client = client or LLMClient()
     
     test_cases = [
         ("simple_lookup", 0.3, "simple"),
@@ -150,19 +249,16 @@ async def test_model_routing():
         ("simple_lookup", 0.9, "simple"),  # Simple type overrides complexity
     ]
     
+    # select_model is pure in (question_type, complexity); memoize per client so
+    # larger routing sweeps don't re-evaluate repeated pairs
+    route = lru_cache(maxsize=128)(client.select_model)
+    
     results = []
     
     for question_type, complexity, expected_tier in test_cases:
-        model = client.select_model(question_type, complexity)
+        model = route(question_type, complexity)
         
-        if "haiku" in model and expected_tier == "simple":
-            correct = True
-        elif "sonnet" in model and expected_tier == "standard":
-            correct = True
-        elif "opus" in model and expected_tier == "advanced":
-            correct = True
-        else:
-            correct = False
+        correct = TIER_TO_MARKER[expected_tier] in model
         
         results.append({
             "question_type": question_type,
@@ -177,7 +273,7 @@ async def test_model_routing():
     return results
 
 
-async def test_rag_pipeline():
+async def test_rag_pipeline(llm_client: Optional[LLMClient] = None, embedding_client=None):
     """Test full RAG pipeline (requires indexed documents)"""
     from app.services.rag_pipeline import RAGPipeline
     from app.core.embedding_client import EmbeddingClient
@@ -191,8 +287,11 @@ async def test_rag_pipeline():
             port=8000,
             settings=ChromaSettings(anonymized_telemetry=False)
         )
-        llm_client = LLMClient()
-        embedding_client = EmbeddingClient()
+        llm_client = llm_client or LLMClient()
+        embedding_client = cache_embeddings(
+            embedding_client or EmbeddingClient(),
+            model_name=settings.EMBEDDING_MODEL
+        )
         
         rag_pipeline = RAGPipeline(chromadb_client, llm_client, embedding_client)
         
@@ -203,36 +302,41 @@ async def test_rag_pipeline():
             "SK하이닉스의 HBM 제품에 대해 알려주세요."
         ]
         
-        results = []
-        
         for question in test_questions:
             logger.info(f"Testing RAG pipeline: {question}")
-            
-            try:
-                answer, sources = await rag_pipeline.generate_response(
-                    question=question,
-                    top_k=3
-                )
-                
-                results.append({
-                    "question": question,
-                    "answer": answer[:200] + "..." if len(answer) > 200 else answer,
-                    "sources": sources,
-                    "success": True,
-                    "error": None
-                })
-                
-                logger.info(f"Found {len(sources)} sources")
-                
-            except Exception as e:
+        
+        responses = await gather_limited([
+            rag_pipeline.generate_response(
+                question=question,
+                top_k=3
+            )
+            for question in test_questions
+        ])
+        
+        results = []
+        
+        for question, response in zip(test_questions, responses):
+            if isinstance(response, Exception):
                 results.append({
                     "question": question,
                     "answer": None,
                     "sources": [],
                     "success": False,
-                    "error": str(e)
+                    "error": str(response)
                 })
-                logger.error(f"Error: {str(e)}")
+                logger.error(f"Error: {str(response)}")
+                continue
+            
+            answer, sources = response
+            results.append({
+                "question": question,
+                "answer": short(answer, 200),
+                "sources": sources,
+                "success": True,
+                "error": None
+            })
+            
+            logger.info(f"Found {len(sources)} sources")
         
         return results
         
@@ -243,42 +347,50 @@ async def test_rag_pipeline():
 
 def print_test_results(test_name: str, results: List[Dict]):
     """Print test results in a formatted way"""
-    print(f"\n{'='*60}")
-    print(f" {test_name}")
-    print(f"{'='*60}")
+    # Collect the report and write it once instead of issuing one print per line
+    lines = [
+        f"\n{'='*60}",
+        f" {test_name}",
+        f"{'='*60}"
+    ]
     
     if not results:
-        print("No results to display")
+        lines.append("No results to display")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
     success_count = sum(1 for r in results if r.get('success', False))
     total_count = len(results)
     
-    print(f"Success Rate: {success_count}/{total_count} ({success_count/total_count*100:.1f}%)\n")
+    lines.append(f"Success Rate: {success_count}/{total_count} ({success_count/total_count*100:.1f}%)\n")
     
     for i, result in enumerate(results, 1):
-        print(f"{i}. {'✅' if result.get('success') else '❌'} ", end="")
+        line = f"{i}. {'✅' if result.get('success') else '❌'} "
         
         if 'prompt' in result:
-            print(f"Prompt: {result['prompt'][:60]}...")
+            line += f"Prompt: {short(result['prompt'], 60)}"
         elif 'question' in result:
-            print(f"Question: {result['question'][:60]}...")
+            line += f"Question: {short(result['question'], 60)}"
         elif 'question_type' in result:
-            print(f"Type: {result['question_type']}, Complexity: {result['complexity']}")
+            line += f"Type: {result['question_type']}, Complexity: {result['complexity']}"
+        lines.append(line)
         
         if result.get('error'):
-            print(f"   Error: {result['error']}")
+            lines.append(f"   Error: {result['error']}")
         elif 'response' in result and result['response']:
-            print(f"   Response: {result['response']}")
+            lines.append(f"   Response: {result['response']}")
         elif 'answer' in result and result['answer']:
-            print(f"   Answer: {result['answer']}")
+            lines.append(f"   Answer: {result['answer']}")
         elif 'selected_model' in result:
-            print(f"   Model: {result['selected_model']}")
+            lines.append(f"   Model: {result['selected_model']}")
         
         if 'sources' in result and result['sources']:
-            print(f"   Sources: {', '.join(result['sources'][:3])}")
+            lines.append(f"   Sources: {', '.join(result['sources'][:3])}")
         
-        print()
+        lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 async def main():
@@ -290,8 +402,19 @@ async def main():
         default="basic",
         help="Type of test to run"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk response cache (.cache/llm) and always call the APIs"
+    )
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="Send one document-analysis request per question instead of a single batched prompt"
+    )
     
     args = parser.parse_args()
+    _llm_cache.enabled = not args.no_cache
     
     print(f"\n🤖 Claude API Test Suite")
     print(f"API Key: {'✅ Configured' if settings.CLAUDE_API_KEY else '❌ Missing'}")
@@ -301,31 +424,33 @@ async def main():
         print("Please set your Claude API key in the .env file")
         return
     
-    if args.test in ["basic", "all"]:
-        logger.info("Running basic completion tests...")
-        results = await test_basic_completion()
-        print_test_results("Basic Completion Tests", results)
-    
-    if args.test in ["document", "all"]:
-        logger.info("Running document analysis tests...")
-        results = await test_document_analysis()
-        print_test_results("Document Analysis Tests", results)
-    
-    if args.test in ["routing", "all"]:
-        logger.info("Running model routing tests...")
-        results = await test_model_routing()
-        print_test_results("Model Routing Tests", results)
-    
-    if args.test in ["rag", "all"]:
-        logger.info("Running RAG pipeline tests...")
-        results = await test_rag_pipeline()
-        if results:
-            print_test_results("RAG Pipeline Tests", results)
-        else:
+    # One client (and so one HTTP connection pool) shared by every suite
+    client = LLMClient()
+    
+    suites = [
+        ("basic", "Basic Completion Tests", partial(test_basic_completion, client)),
+        ("document", "Document Analysis Tests", partial(test_document_analysis, client, batch=not args.no_batch)),
+        ("routing", "Model Routing Tests", partial(test_model_routing, client)),
+        ("rag", "RAG Pipeline Tests", partial(test_rag_pipeline, llm_client=client)),
+    ]
+    jobs = [(title, suite()) for name, title, suite in suites if args.test in [name, "all"]]
+    
+    # Suites are independent, so run them together and print in the original order
+    logger.info(f"Running {len(jobs)} test suite(s)...")
+    titles, coros = zip(*jobs)
+    results_list = await asyncio.gather(*coros, return_exceptions=True)
+    
+    for title, results in zip(titles, results_list):
+        if isinstance(results, Exception):
+            logger.error(f"{title} failed: {str(results)}")
+            print(f"\n❌ {title} failed: {str(results)}")
+        elif title == "RAG Pipeline Tests" and not results:
             print("\n⚠️  RAG pipeline tests require indexed documents.")
             print("   Run the indexing scripts first:")
             print("   1. python scripts/setup_file_system.py --with-samples")
             print("   2. python scripts/index_documents.py")
+        else:
+            print_test_results(title, results)
     
     print("\n✅ Test suite completed!")
 
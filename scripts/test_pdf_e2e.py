@@ -7,10 +7,17 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import glob
+import argparse
+import asyncio
+import hashlib
 import json
+import shutil
+import string
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
+from pathlib import Path
 from typing import List, Dict, Any
 import fitz  # PyMuPDF
 
@@ -19,6 +26,36 @@ from app.services.pdf_splitter import PDFSplitter
 from app.services.claude_service import ClaudeService
 from app.core.config import settings
 
+from _pdf_files import iter_pdf_paths
+from _text import short
+
+# Generated test PDFs are deterministic, so they are cached here between runs.
+# The key changes whenever this file does, which invalidates stale fixtures.
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+FIXTURE_KEY = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+# Concurrent Claude requests in the E2E pipeline
+CLAUDE_WORKERS = 4
+
+# Test PDFs are saved without garbage collection, cleaning or deflate;
+# compression is PDFOptimizer's job, so it should do the only pass
+RAW_SAVE_OPTIONS = {"garbage": 0, "deflate": False, "clean": False, "linear": False}
+
+
+# Page geometry shared by the generators (A4 in points), built once
+A4_RECT = fitz.Rect(0, 0, 595, 842)
+TEXT_HEAVY_RECT = fitz.Rect(50, 50, 545, 792)
+SCANNED_TEXT_RECT = fitz.Rect(60, 60, 535, 782)
+LARGE_TEXT_RECT = fitz.Rect(40, 40, 555, 802)
+BAR_X_SPANS = [(100 + i * 80, 150 + i * 80) for i in range(5)]
+PIE_CENTER = fitz.Point(400, 600)
+
+
+def _copy_template_page(pdf: fitz.Document, page_count: int):
+    """Fill the document up to page_count pages with full copies of page 0"""
+    for _ in range(page_count - 1):
+        pdf.fullcopy_page(0)
+
 
 class PDFTestCase:
     """Represents a test case for PDF processing"""
@@ -27,12 +64,29 @@ class PDFTestCase:
         self.name = name
         self.description = description
         self.pdf_path = pdf_path
+        # Checked once here rather than on every pass through the test loop
+        self.pdf_exists = bool(pdf_path) and os.path.exists(pdf_path)
         self.content = None
         self.results = {}
+        self.fixture_path = FIXTURE_DIR / f"{name}_{FIXTURE_KEY}.pdf"
         
     def create_test_pdf(self) -> bytes:
         """Override this method to create test PDFs"""
         raise NotImplementedError
+    
+    def get_or_create_pdf(self) -> bytes:
+        """Return the cached fixture PDF, generating and caching it on a miss"""
+        if self.fixture_path.exists():
+            return self.fixture_path.read_bytes()
+        
+        content = self.create_test_pdf()
+        self.fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a per-process temp file and rename, so concurrent workers
+        # and interrupted runs never leave a truncated fixture behind
+        tmp_path = self.fixture_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        tmp_path.replace(self.fixture_path)
+        return content
         
     def get_test_questions(self) -> List[str]:
         """Return questions to ask Claude about this PDF"""
@@ -48,12 +102,12 @@ class TextHeavyPDFTest(PDFTestCase):
     def create_test_pdf(self) -> bytes:
         pdf = fitz.open()
         
-        # Create 30 pages of dense financial text
-        for page_num in range(30):
-            page = pdf.new_page(width=595, height=842)
-            
-            text = f"""
-2024년 재무제표 - 페이지 {page_num + 1}
+        # Create 30 pages of dense financial text. The body is laid out once on a
+        # template page (header line left blank) and copied; only the header varies.
+        page = pdf.new_page(width=595, height=842)
+        
+        text = """
+
 
 1. 재무상태표 (단위: 백만원)
 ===========================
@@ -92,11 +146,16 @@ class TextHeavyPDFTest(PDFTestCase):
 법인세비용                    (4,444,336)
 당기순이익                    15,432,198
 """
-            
-            text_rect = fitz.Rect(50, 50, 545, 792)
-            page.insert_textbox(text_rect, text, fontsize=9, fontname="helv")
         
-        content = pdf.tobytes()
+        page.insert_textbox(TEXT_HEAVY_RECT, text, fontsize=9, fontname="helv")
+        _copy_template_page(pdf, 30)
+        
+        for page_num, page in enumerate(pdf):
+            # Same rect and font as the body, so the header lands on the blank line
+            page.insert_textbox(TEXT_HEAVY_RECT, f"\n2024년 재무제표 - 페이지 {page_num + 1}",
+                                fontsize=9, fontname="helv", overlay=False)
+        
+        content = pdf.tobytes(**RAW_SAVE_OPTIONS)
         pdf.close()
         return content
 
@@ -107,35 +166,36 @@ class ImageHeavyPDFTest(PDFTestCase):
     def create_test_pdf(self) -> bytes:
         pdf = fitz.open()
         
-        # Create 20 pages with images and charts
-        for page_num in range(20):
-            page = pdf.new_page(width=595, height=842)
-            
-            # Add title
-            page.insert_text((50, 50), f"차트 및 그래프 분석 - 페이지 {page_num + 1}", fontsize=14)
-            
-            # Simulate charts with shapes
-            # Bar chart
-            for i in range(5):
-                height = 50 + i * 20
-                rect = fitz.Rect(100 + i * 80, 400 - height, 150 + i * 80, 400)
-                page.draw_rect(rect, fill=(0.2, 0.4, 0.8))
-                page.insert_text((110 + i * 80, 420), f"{(i+1)*1000}억", fontsize=8)
-            
-            # Pie chart simulation
-            center = fitz.Point(400, 600)
-            page.draw_circle(center, 80, fill=(0.9, 0.9, 0.9))
-            
-            # Add data table
-            table_text = """
+        # Create 20 pages with images and charts. The charts are drawn once on a
+        # template page and copied; only the title varies.
+        page = pdf.new_page(width=595, height=842)
+        
+        # Simulate charts with shapes
+        # Bar chart
+        for i, (x0, x1) in enumerate(BAR_X_SPANS):
+            height = 50 + i * 20
+            page.draw_rect((x0, 400 - height, x1, 400), fill=(0.2, 0.4, 0.8))
+            page.insert_text((110 + i * 80, 420), f"{(i+1)*1000}억", fontsize=8)
+        
+        # Pie chart simulation
+        page.draw_circle(PIE_CENTER, 80, fill=(0.9, 0.9, 0.9))
+        
+        # Add data table
+        table_text = """
             구분        2023년      2024년      증감률
             매출        1,234       1,567       27.0%
             영업이익      234         345       47.4%
             순이익        123         198       61.0%
             """
-            page.insert_text((50, 700), table_text, fontsize=10)
+        page.insert_text((50, 700), table_text, fontsize=10)
+        _copy_template_page(pdf, 20)
         
-        content = pdf.tobytes()
+        for page_num, page in enumerate(pdf):
+            # Add title
+            page.insert_text((50, 50), f"차트 및 그래프 분석 - 페이지 {page_num + 1}",
+                             fontsize=14, overlay=False)
+        
+        content = pdf.tobytes(**RAW_SAVE_OPTIONS)
         pdf.close()
         return content
 
@@ -151,7 +211,7 @@ class ScannedPDFTest(PDFTestCase):
             page = pdf.new_page(width=595, height=842)
             
             # Add background to simulate scan
-            page.draw_rect(page.rect, fill=(0.95, 0.95, 0.92))
+            page.draw_rect(A4_RECT, fill=(0.95, 0.95, 0.92))
             
             # Add slightly rotated text to simulate scan imperfection
             text = f"""
@@ -177,15 +237,44 @@ class ScannedPDFTest(PDFTestCase):
 """
             
             # Add text with slight gray color to simulate scan
-            text_rect = fitz.Rect(60, 60, 535, 782)
-            page.insert_textbox(text_rect, text, fontsize=11, 
+            page.insert_textbox(SCANNED_TEXT_RECT, text, fontsize=11, 
                               fontname="helv", color=(0.2, 0.2, 0.2))
         
-        content = pdf.tobytes()
+        content = pdf.tobytes(**RAW_SAVE_OPTIONS)
         pdf.close()
         return content
 
 
+# Section text for VeryLargePDFTest; $quarter is filled in per page
+SECTION_TEMPLATE = string.Template("""
+섹션 $section: 상세 분석 보고서
+
+본 섹션에서는 2024년 ${quarter}분기 실적에 대한 상세한 분석을 제공합니다.
+주요 성과 지표는 다음과 같습니다:
+
+- KPI 1: 목표 대비 $kpi1% 달성
+- KPI 2: 전년 동기 대비 $kpi2% 성장
+- KPI 3: 시장 점유율 $kpi3% 확보
+
+상세 분석:
+Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor 
+incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis 
+nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat.
+
+""")
+PAGE_HEADER_RULE = "=" * 50
+# Five sections, each repeated twice, with the per-section KPIs pre-filled
+LARGE_PAGE_BODY = string.Template("".join(
+    SECTION_TEMPLATE.safe_substitute(
+        section=section + 1,
+        kpi1=120 + section * 5,
+        kpi2=15 + section * 3,
+        kpi3=25 + section * 2
+    ) * 2
+    for section in range(5)
+))
+
+
 class VeryLargePDFTest(PDFTestCase):
     """Test case for very large PDFs that require splitting"""
     
@@ -196,37 +285,101 @@ class VeryLargePDFTest(PDFTestCase):
         for page_num in range(200):
             page = pdf.new_page(width=595, height=842)
             
-            # Create dense content
-            long_text = f"페이지 {page_num + 1}\n" + ("=" * 50) + "\n"
+            # Create dense content (only the quarter number varies per page)
+            long_text = (
+                f"페이지 {page_num + 1}\n{PAGE_HEADER_RULE}\n"
+                + LARGE_PAGE_BODY.substitute(quarter=page_num + 1)
+            )
             
-            # Add substantial content
-            for section in range(5):
-                long_text += f"""
-섹션 {section + 1}: 상세 분석 보고서
+            page.insert_textbox(LARGE_TEXT_RECT, long_text, fontsize=9, fontname="helv")
+        
+        content = pdf.tobytes(**RAW_SAVE_OPTIONS)
+        pdf.close()
+        return content
 
-본 섹션에서는 2024년 {page_num + 1}분기 실적에 대한 상세한 분석을 제공합니다.
-주요 성과 지표는 다음과 같습니다:
 
-- KPI 1: 목표 대비 {120 + section * 5}% 달성
-- KPI 2: 전년 동기 대비 {15 + section * 3}% 성장
-- KPI 3: 시장 점유율 {25 + section * 2}% 확보
+def _optimize_and_split(
+    optimizer: PDFOptimizer,
+    splitter: PDFSplitter,
+    name: str,
+    pdf_content: bytes
+) -> Dict[str, Any]:
+    """CPU stage for one test case: optimize, then split check (runs in a worker process)"""
+    start_time = time.time()
+    opt_content, opt_metadata = optimizer.optimize_pdf(
+        pdf_content,
+        compression_level=CompressionLevel.EBOOK
+    )
+    opt_time = time.time() - start_time
+    
+    split_files, split_metadata = splitter.check_and_split(
+        opt_content,
+        f"test_{name}.pdf"
+    )
+    
+    # Everything returned is pickled back to the parent process, so send part
+    # metadata only and the bytes of the first part (the one Claude is tested on)
+    return {
+        "opt_size_mb": len(opt_content) / (1024 * 1024),
+        "opt_metadata": opt_metadata,
+        "opt_time": opt_time,
+        "split_parts": [
+            {key: value for key, value in file_info.items() if key != "content"}
+            for file_info in split_files
+        ],
+        "first_part_content": split_files[0]["content"],
+        "split_metadata": split_metadata
+    }
 
-상세 분석:
-Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor 
-incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis 
-nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat.
 
-""" * 2
-            
-            text_rect = fitz.Rect(40, 40, 555, 802)
-            page.insert_textbox(text_rect, long_text, fontsize=9, fontname="helv")
-        
-        content = pdf.tobytes()
-        pdf.close()
-        return content
+def _format_case_result(
+    idx: int,
+    total: int,
+    test_case: PDFTestCase,
+    result: Dict[str, Any],
+    parts: List[Dict]
+) -> List[str]:
+    """Format one test case's stage output as report lines"""
+    lines = [
+        f"\nTest Case {idx}/{total}: {test_case.description}",
+        "-" * 60
+    ]
+    
+    if "original_size_mb" in result:
+        lines.append(f"Original size: {result['original_size_mb']:.2f} MB")
+    
+    if "optimization" in result:
+        optimization = result["optimization"]
+        lines.append("\nStep 1: Optimization...")
+        lines.append(f"Optimized size: {optimization['size_mb']:.2f} MB ({optimization['compression_ratio']:.1%} of original)")
+        lines.append(f"Time: {optimization['time_seconds']:.2f}s")
+    
+    if "splitting" in result:
+        lines.append("\nStep 2: Split check...")
+        if result["splitting"]["performed"]:
+            lines.append(f"Split into {result['splitting']['file_count']} files")
+            for i, file_info in enumerate(parts, 1):
+                lines.append(f"  Part {i}: {file_info['size_mb']} MB, {file_info['pages']} pages")
+        else:
+            lines.append("No splitting needed")
+    
+    if "claude_test" in result:
+        lines.append("\nStep 3: Claude API test...")
+        claude_test = result["claude_test"]
+        if claude_test["success"]:
+            lines.append(f"Claude API: Success")
+            lines.append(f"Model: {claude_test['model_used']}")
+            lines.append(f"Tokens: {claude_test['tokens_used']}")
+        else:
+            lines.append(f"Claude API: Failed - {claude_test['error']}")
+    
+    if not result.get("success"):
+        lines.append(f"ERROR: {result.get('error')}")
+    
+    return lines
 
 
-def run_e2e_tests():
+async def run_e2e_tests():
     """Run comprehensive E2E tests"""
     print("PDF Processing E2E Test Suite")
     print("=" * 80)
@@ -249,15 +402,16 @@ def run_e2e_tests():
     print()
     
     # Define test cases
-    test_cases = [
+    synthetic_cases = [
         TextHeavyPDFTest("text_heavy", "텍스트 위주 재무제표"),
         ImageHeavyPDFTest("image_heavy", "이미지/차트 포함 보고서"),
         ScannedPDFTest("scanned", "스캔된 문서"),
         VeryLargePDFTest("very_large", "대용량 문서 (분할 필요)")
     ]
+    test_cases = list(synthetic_cases)
     
     # Add real PDFs if available
-    real_pdfs = glob.glob("data/financial_docs/**/*.pdf", recursive=True)[:2]
+    real_pdfs = islice(iter_pdf_paths("data/financial_docs"), 2)
     for pdf_path in real_pdfs:
         test_case = PDFTestCase(
             f"real_{os.path.basename(pdf_path)}", 
@@ -266,144 +420,172 @@ def run_e2e_tests():
         )
         test_cases.append(test_case)
     
-    # Run tests
-    all_results = []
-    
-    for idx, test_case in enumerate(test_cases, 1):
-        print(f"\nTest Case {idx}/{len(test_cases)}: {test_case.description}")
-        print("-" * 60)
-        
-        result = {
+    results = {
+        test_case.name: {
             "test_case": test_case.name,
             "description": test_case.description,
             "timestamp": datetime.now().isoformat()
         }
-        
-        try:
-            # Get PDF content
-            if test_case.pdf_path and os.path.exists(test_case.pdf_path):
-                with open(test_case.pdf_path, "rb") as f:
-                    pdf_content = f.read()
-            else:
-                pdf_content = test_case.create_test_pdf()
-            
-            original_size_mb = len(pdf_content) / (1024 * 1024)
-            result["original_size_mb"] = round(original_size_mb, 2)
-            print(f"Original size: {original_size_mb:.2f} MB")
-            
-            # Step 1: Optimization
-            print("\nStep 1: Optimization...")
-            start_time = time.time()
-            
-            opt_content, opt_metadata = optimizer.optimize_pdf(
-                pdf_content,
-                compression_level=CompressionLevel.EBOOK
-            )
-            
-            opt_time = time.time() - start_time
-            opt_size_mb = len(opt_content) / (1024 * 1024)
-            
-            result["optimization"] = {
-                "size_mb": round(opt_size_mb, 2),
-                "compression_ratio": opt_metadata.get("compression_ratio", 1.0),
-                "time_seconds": round(opt_time, 2),
-                "methods": opt_metadata.get("compression_methods", [])
-            }
-            
-            print(f"Optimized size: {opt_size_mb:.2f} MB ({opt_metadata.get('compression_ratio', 1.0):.1%} of original)")
-            print(f"Time: {opt_time:.2f}s")
-            
-            # Step 2: Splitting check
-            print("\nStep 2: Split check...")
-            split_files, split_metadata = splitter.check_and_split(
-                opt_content,
-                f"test_{test_case.name}.pdf"
-            )
-            
-            result["splitting"] = {
-                "needed": split_metadata["needs_splitting"],
-                "performed": split_metadata["split_performed"],
-                "file_count": len(split_files)
-            }
-            
-            if split_metadata["split_performed"]:
-                print(f"Split into {len(split_files)} files")
-                for i, file_info in enumerate(split_files[:3], 1):  # Show first 3
-                    print(f"  Part {i}: {file_info['size_mb']} MB, {file_info['pages']} pages")
-            else:
-                print("No splitting needed")
-            
-            # Step 3: Claude API test (if available)
-            if use_claude and isinstance(test_case, TextHeavyPDFTest):
-                print("\nStep 3: Claude API test...")
+        for test_case in test_cases
+    }
+    split_parts = {}
+    
+    # Each finished case is appended to a JSONL log right away, so an
+    # interrupted run still leaves its partial results on disk
+    report_filename = f"pdf_e2e_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    progress_file = open(report_filename + "l", "w", encoding="utf-8")
+    
+    def record(test_case: PDFTestCase):
+        progress_file.write(json.dumps(results[test_case.name], ensure_ascii=False) + "\n")
+        progress_file.flush()
+    
+    # Pipeline: the CPU stage (optimize + split) feeds the Claude stage, so
+    # case N+1 is being optimized while case N waits on the API. One CPU
+    # worker per pool process lets independent cases optimize in parallel.
+    cpu_workers = min(os.cpu_count() or 1, len(test_cases))
+    loop = asyncio.get_running_loop()
+    cpu_queue: asyncio.Queue = asyncio.Queue()
+    claude_queue: asyncio.Queue = asyncio.Queue()
+    
+    async def cpu_worker(executor: ProcessPoolExecutor):
+        while True:
+            test_case = await cpu_queue.get()
+            result = results[test_case.name]
+            queued_for_claude = False
+            try:
+                # Get PDF content
+                if test_case.pdf_exists:
+                    with open(test_case.pdf_path, "rb") as f:
+                        pdf_content = f.read()
+                else:
+                    pdf_content = await asyncio.wrap_future(pdf_futures[test_case.name])
                 
-                # Use first file (whether split or not)
-                test_content = split_files[0]["content"]
+                result["original_size_mb"] = round(len(pdf_content) / (1024 * 1024), 2)
                 
-                try:
-                    # Create a minimal test
-                    import asyncio
-                    response = asyncio.run(claude_service.analyze_pdf_with_question(
-                        pdf_content=test_content,
-                        question="이 문서의 종류와 주요 내용을 간단히 설명해주세요.",
-                        company_name="테스트회사",
-                        doc_type="테스트문서",
-                        doc_year=2024
-                    ))
-                    
-                    result["claude_test"] = {
-                        "success": True,
-                        "model_used": response.get("model_used"),
-                        "tokens_used": response.get("usage", {}).get("total_tokens", 0),
-                        "response_preview": response.get("answer", "")[:100] + "..."
-                    }
-                    
-                    print(f"Claude API: Success")
-                    print(f"Model: {response.get('model_used')}")
-                    print(f"Tokens: {response.get('usage', {}).get('total_tokens', 0)}")
-                    
-                except Exception as e:
-                    result["claude_test"] = {
-                        "success": False,
-                        "error": str(e)
-                    }
-                    print(f"Claude API: Failed - {e}")
-            
-            result["success"] = True
-            
-        except Exception as e:
-            result["success"] = False
-            result["error"] = str(e)
-            print(f"ERROR: {e}")
+                # Step 1 + 2: Optimization and split check
+                stage = await loop.run_in_executor(
+                    executor, _optimize_and_split, optimizer, splitter, test_case.name, pdf_content
+                )
+                opt_metadata = stage["opt_metadata"]
+                split_files = stage["split_parts"]
+                split_metadata = stage["split_metadata"]
+                
+                result["optimization"] = {
+                    "size_mb": round(stage["opt_size_mb"], 2),
+                    "compression_ratio": opt_metadata.get("compression_ratio", 1.0),
+                    "time_seconds": round(stage["opt_time"], 2),
+                    "methods": opt_metadata.get("compression_methods", [])
+                }
+                result["splitting"] = {
+                    "needed": split_metadata["needs_splitting"],
+                    "performed": split_metadata["split_performed"],
+                    "file_count": len(split_files)
+                }
+                split_parts[test_case.name] = [
+                    {"size_mb": f["size_mb"], "pages": f["pages"]} for f in split_files[:3]  # Show first 3
+                ]
+                
+                # Step 3: Claude API test (if available), using the first file whether split or not
+                if use_claude and isinstance(test_case, TextHeavyPDFTest):
+                    claude_queue.put_nowait((test_case, stage["first_part_content"]))
+                    queued_for_claude = True
+                
+                result["success"] = True
+                
+            except Exception as e:
+                result["success"] = False
+                result["error"] = str(e)
+            finally:
+                if not queued_for_claude:
+                    record(test_case)
+                cpu_queue.task_done()
+    
+    async def claude_worker():
+        while True:
+            test_case, test_content = await claude_queue.get()
+            result = results[test_case.name]
+            try:
+                # Create a minimal test
+                response = await claude_service.analyze_pdf_with_question(
+                    pdf_content=test_content,
+                    question="이 문서의 종류와 주요 내용을 간단히 설명해주세요.",
+                    company_name="테스트회사",
+                    doc_type="테스트문서",
+                    doc_year=2024
+                )
+                
+                result["claude_test"] = {
+                    "success": True,
+                    "model_used": response.get("model_used"),
+                    "tokens_used": response.get("usage", {}).get("total_tokens", 0),
+                    "response_preview": short(response.get("answer", ""), 100)
+                }
+                
+            except Exception as e:
+                result["claude_test"] = {
+                    "success": False,
+                    "error": str(e)
+                }
+            finally:
+                record(test_case)
+                claude_queue.task_done()
+    
+    # One pool for both fixture generation and the CPU stage
+    with progress_file, ProcessPoolExecutor(max_workers=cpu_workers) as executor:
+        # Synthetic PDF generation is pure CPU work; start all of them up front
+        pdf_futures = {
+            test_case.name: executor.submit(test_case.get_or_create_pdf)
+            for test_case in synthetic_cases
+        }
+        
+        for test_case in test_cases:
+            cpu_queue.put_nowait(test_case)
         
+        workers = [asyncio.create_task(cpu_worker(executor)) for _ in range(cpu_workers)]
+        workers += [asyncio.create_task(claude_worker()) for _ in range(CLAUDE_WORKERS)]
+        
+        await cpu_queue.join()
+        await claude_queue.join()
+        for worker in workers:
+            worker.cancel()
+    
+    # Report in test case order so the log reads the same regardless of completion
+    # order; the whole report is built first and written in one go
+    report = []
+    all_results = []
+    for idx, test_case in enumerate(test_cases, 1):
+        result = results[test_case.name]
+        report += _format_case_result(idx, len(test_cases), test_case, result, split_parts.get(test_case.name, []))
         all_results.append(result)
     
     # Generate report
-    print("\n" + "=" * 80)
-    print("TEST SUMMARY")
-    print("=" * 80)
+    report.append("\n" + "=" * 80)
+    report.append("TEST SUMMARY")
+    report.append("=" * 80)
     
     success_count = sum(1 for r in all_results if r.get("success"))
-    print(f"Total tests: {len(all_results)}")
-    print(f"Successful: {success_count}")
-    print(f"Failed: {len(all_results) - success_count}")
+    report.append(f"Total tests: {len(all_results)}")
+    report.append(f"Successful: {success_count}")
+    report.append(f"Failed: {len(all_results) - success_count}")
     
-    print("\nCompression Performance:")
+    report.append("\nCompression Performance:")
     compression_ratios = [r["optimization"]["compression_ratio"] 
                          for r in all_results 
                          if r.get("success") and "optimization" in r]
     if compression_ratios:
-        print(f"Average compression: {sum(compression_ratios)/len(compression_ratios):.1%}")
-        print(f"Best compression: {min(compression_ratios):.1%}")
-        print(f"Worst compression: {max(compression_ratios):.1%}")
+        report.append(f"Average compression: {sum(compression_ratios)/len(compression_ratios):.1%}")
+        report.append(f"Best compression: {min(compression_ratios):.1%}")
+        report.append(f"Worst compression: {max(compression_ratios):.1%}")
     
-    print("\nSplitting Summary:")
+    report.append("\nSplitting Summary:")
     split_count = sum(1 for r in all_results 
                      if r.get("splitting", {}).get("performed"))
-    print(f"Files requiring split: {split_count}/{len(all_results)}")
+    report.append(f"Files requiring split: {split_count}/{len(all_results)}")
+    
+    sys.stdout.write("\n".join(report) + "\n")
+    sys.stdout.flush()
     
     # Save detailed results
-    report_filename = f"pdf_e2e_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     with open(report_filename, "w", encoding="utf-8") as f:
         json.dump({
             "test_date": datetime.now().isoformat(),
@@ -412,7 +594,7 @@ def run_e2e_tests():
             "results": all_results
         }, f, indent=2, ensure_ascii=False)
     
-    print(f"\nDetailed report saved to: {report_filename}")
+    print(f"\nDetailed report saved to: {report_filename} (per-case log: {report_filename}l)")
     
     return all_results
 
@@ -467,8 +649,19 @@ def test_failure_cases():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF processing E2E tests")
+    parser.add_argument(
+        "--refresh-fixtures",
+        action="store_true",
+        help=f"Delete cached test PDFs in {FIXTURE_DIR} and regenerate them"
+    )
+    args = parser.parse_args()
+    
+    if args.refresh_fixtures:
+        shutil.rmtree(FIXTURE_DIR, ignore_errors=True)
+    
     # Run main E2E tests
-    results = run_e2e_tests()
+    results = asyncio.run(run_e2e_tests())
     
     # Run failure case tests
     test_failure_cases()
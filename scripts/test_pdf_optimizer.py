@@ -7,16 +7,54 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.services.pdf_optimizer import PDFOptimizer, CompressionLevel
-import glob
+from _pdf_files import iter_pdf_paths
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import fitz
 import json
 
+# Number of sample PDFs to test, and the levels each one is compressed with
+MAX_TEST_FILES = 3
+COMPRESSION_LEVELS = (CompressionLevel.SCREEN, CompressionLevel.EBOOK)
+
+
+def content_streams_compressed(pdf_content: bytes) -> bool:
+    """Check whether every page content stream already has a Filter (cheap xref scan)"""
+    with fitz.open(stream=pdf_content, filetype="pdf") as doc:
+        return all(
+            doc.xref_get_key(xref, "Filter")[0] != "null"
+            for page in doc
+            for xref in page.get_contents()
+        )
+
+
+def _optimize_file(pdf_path: str, level: CompressionLevel):
+    """Optimize one PDF at one level (runs in a worker process)"""
+    with open(pdf_path, "rb") as f:
+        original_content = f.read()
+    
+    # Ghostscript's full recompression pass is wasted on already compressed
+    # content; the PyMuPDF garbage-collection pass still runs. If the probe
+    # cannot parse the file, leave Ghostscript on and let optimize_pdf handle it
+    try:
+        use_ghostscript = not content_streams_compressed(original_content)
+    except Exception:
+        use_ghostscript = True
+    
+    optimized_content, metadata = PDFOptimizer().optimize_pdf(
+        pdf_content=original_content,
+        compression_level=level,
+        use_ghostscript=use_ghostscript
+    )
+    return len(original_content), optimized_content, metadata
+
 
 def test_pdf_optimization():
     """Test PDF optimization with sample files"""
     optimizer = PDFOptimizer()
     
     # Find sample PDF files
-    pdf_files = glob.glob("data/financial_docs/**/*.pdf", recursive=True)
+    pdf_files = list(islice(iter_pdf_paths("data/financial_docs"), MAX_TEST_FILES))
     
     if not pdf_files:
         print("No PDF files found in data/financial_docs/")
@@ -24,32 +62,55 @@ def test_pdf_optimization():
     
     print(f"Found {len(pdf_files)} PDF files to test\n")
     
+    # Files already under the Claude API size limit skip optimization entirely
+    # (no Ghostscript fork+exec)
+    skip_below_mb = optimizer.max_file_size / (1024 * 1024)
+    file_sizes_mb = {pdf_path: os.path.getsize(pdf_path) / (1024 * 1024) for pdf_path in pdf_files}
+    
+    # Ghostscript runs are CPU-bound and independent, so run every
+    # (file, level) pair in parallel and report in the original order
+    tasks = [
+        (pdf_path, level)
+        for pdf_path in pdf_files
+        if file_sizes_mb[pdf_path] >= skip_below_mb
+        for level in COMPRESSION_LEVELS
+    ]
+    futures = {}
+    if tasks:
+        with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+            futures = {task: executor.submit(_optimize_file, *task) for task in tasks}
+    
     results = []
+    # (original_size, optimized_size, metadata) of the last successful run
+    last_success = None
     
-    for pdf_path in pdf_files[:3]:  # Test first 3 files
+    for pdf_path in pdf_files:
+        if file_sizes_mb[pdf_path] < skip_below_mb:
+            print(f"\nSkipping: {pdf_path} ({file_sizes_mb[pdf_path]:.2f} MB "
+                  f"< {skip_below_mb} MB)")
+            results.append({
+                "file": os.path.basename(pdf_path),
+                "original_size_mb": round(file_sizes_mb[pdf_path], 2),
+                "skipped": True
+            })
+            continue
+        
         print(f"\nTesting: {pdf_path}")
         print("-" * 50)
         
-        try:
-            # Read PDF file
-            with open(pdf_path, "rb") as f:
-                original_content = f.read()
-            
-            original_size_mb = len(original_content) / (1024 * 1024)
-            print(f"Original size: {original_size_mb:.2f} MB")
-            
-            # Test different compression levels
-            for level in [CompressionLevel.SCREEN, CompressionLevel.EBOOK]:
-                print(f"\nTesting {level.name} compression...")
+        for level in COMPRESSION_LEVELS:
+            future = futures[(pdf_path, level)]
+            try:
+                original_size, optimized_content, metadata = future.result()
                 
-                optimized_content, metadata = optimizer.optimize_pdf(
-                    pdf_content=original_content,
-                    compression_level=level,
-                    use_ghostscript=True
-                )
+                original_size_mb = original_size / (1024 * 1024)
+                if level is COMPRESSION_LEVELS[0]:
+                    print(f"Original size: {original_size_mb:.2f} MB")
+                
+                print(f"\nTesting {level.name} compression...")
                 
                 optimized_size_mb = len(optimized_content) / (1024 * 1024)
-                compression_ratio = (1 - len(optimized_content) / len(original_content)) * 100
+                compression_ratio = (1 - len(optimized_content) / original_size) * 100
                 
                 print(f"Optimized size: {optimized_size_mb:.2f} MB")
                 print(f"Compression: {compression_ratio:.1f}%")
@@ -65,6 +126,7 @@ def test_pdf_optimization():
                     "metadata": metadata
                 }
                 results.append(result)
+                last_success = (original_size, len(optimized_content), metadata)
                 
                 # Save optimized file for inspection
                 output_path = f"test_output_{os.path.basename(pdf_path).replace('.pdf', '')}_{level.name}.pdf"
@@ -72,12 +134,13 @@ def test_pdf_optimization():
                     f.write(optimized_content)
                 print(f"Saved optimized file: {output_path}")
                 
-        except Exception as e:
-            print(f"Error processing {pdf_path}: {e}")
-            results.append({
-                "file": os.path.basename(pdf_path),
-                "error": str(e)
-            })
+            except Exception as e:
+                print(f"Error processing {pdf_path} ({level.name}): {e}")
+                results.append({
+                    "file": os.path.basename(pdf_path),
+                    "compression_level": level.name,
+                    "error": str(e)
+                })
     
     # Save results to JSON
     with open("pdf_optimization_results.json", "w", encoding="utf-8") as f:
@@ -88,15 +151,21 @@ def test_pdf_optimization():
     for result in results:
         if "error" in result:
             print(f"{result['file']}: ERROR - {result['error']}")
+        elif result.get("skipped"):
+            print(f"{result['file']}: skipped ({result['original_size_mb']} MB)")
         else:
             print(f"{result['file']} ({result['compression_level']}): "
                   f"{result['original_size_mb']} MB → {result['optimized_size_mb']} MB "
                   f"({result['compression_ratio']}% reduction)")
     
-    # Generate report
+    if last_success is None:
+        return
+    
+    # Generate report for the last successful optimization
+    original_size, optimized_size, metadata = last_success
     report = optimizer.get_optimization_report(
-        original_size=int(original_size_mb * 1024 * 1024),
-        optimized_size=int(optimized_size_mb * 1024 * 1024),
+        original_size=original_size,
+        optimized_size=optimized_size,
         metadata=metadata
     )
     print("\n" + report)
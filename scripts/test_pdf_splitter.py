@@ -7,14 +7,13 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.services.pdf_splitter import PDFSplitter
+import fitz
 import glob
 import json
 
 
 def create_large_test_pdf():
     """Create a large test PDF for splitting tests"""
-    import fitz
-    
     # Create a PDF with many pages
     pdf = fitz.open()
     
@@ -38,8 +37,11 @@ Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris.
 - 당기순이익: 123,456,789원
 """
         
+        # Batch all drawing into one Shape so each page gets a single content stream
+        shape = page.new_shape()
+        
         text_rect = fitz.Rect(50, 50, 545, 792)
-        page.insert_textbox(text_rect, text, fontsize=11, fontname="helv")
+        shape.insert_textbox(text_rect, text, fontsize=11, fontname="helv")
         
         # Add a simple table
         table_start_y = 400
@@ -47,12 +49,15 @@ Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris.
             for col in range(4):
                 cell_rect = fitz.Rect(50 + col * 120, table_start_y + row * 25, 
                                      165 + col * 120, table_start_y + (row + 1) * 25)
-                page.draw_rect(cell_rect)
-                page.insert_text((55 + col * 120, table_start_y + row * 25 + 15), 
-                               f"Cell {row},{col}")
+                shape.draw_rect(cell_rect)
+                shape.finish()
+                shape.insert_text((55 + col * 120, table_start_y + row * 25 + 15), 
+                                  f"Cell {row},{col}")
+        
+        shape.commit()
     
-    # Save the PDF
-    content = pdf.tobytes()
+    # Save the PDF (garbage-collected and deflated, like the splitter's own output)
+    content = pdf.tobytes(garbage=4, deflate=True, deflate_images=True, deflate_fonts=True, clean=True)
     pdf.close()
     
     return content, "large_test_document.pdf"
@@ -103,7 +108,10 @@ def test_pdf_splitting():
     with open("test_large.pdf", "wb") as f:
         f.write(large_content)
     
-    split_files, metadata = splitter.check_and_split(large_content, large_filename)
+    # Parse the large PDF once and share it across Tests 2-4
+    large_doc = fitz.open(stream=large_content, filetype="pdf")
+    
+    split_files, metadata = splitter.check_and_split_doc(large_doc, large_content, large_filename)
     
     print(f"Original size: {metadata['original_size_mb']} MB")
     print(f"Needs splitting: {metadata['needs_splitting']}")
@@ -128,7 +136,8 @@ def test_pdf_splitting():
     print("\nTest 3: Custom pages per chunk (10 pages)")
     print("-" * 40)
     
-    split_files_custom, metadata_custom = splitter.check_and_split(
+    split_files_custom, metadata_custom = splitter.check_and_split_doc(
+        large_doc,
         large_content, 
         "custom_chunk_test.pdf",
         pages_per_chunk=10
@@ -141,7 +150,10 @@ def test_pdf_splitting():
     print("\nTest 4: Calculate optimal chunk size")
     print("-" * 40)
     
-    optimal_pages = splitter.calculate_optimal_chunk_size(large_content, target_chunk_size_mb=5.0)
+    optimal_pages = splitter.calculate_optimal_chunk_size_doc(
+        large_doc, large_content, target_chunk_size_mb=5.0
+    )
+    large_doc.close()
     print(f"Optimal pages per chunk for 5MB target: {optimal_pages}")
     
     # Generate report
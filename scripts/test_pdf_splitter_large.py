@@ -12,16 +12,13 @@ import fitz
 
 def create_very_large_pdf():
     """Create a very large PDF that exceeds 10MB"""
-    pdf = fitz.open()
+    # Create 500 pages with images. Text layout is the expensive part, so one
+    # template page is built and copied; only the page header varies.
+    template = fitz.open()
+    page = template.new_page(width=595, height=842)  # A4
     
-    # Create 500 pages with images
-    for page_num in range(500):
-        page = pdf.new_page(width=595, height=842)  # A4
-        
-        # Add substantial text content
-        long_text = f"""
-페이지 {page_num + 1} / 500
-
+    # Add substantial text content
+    long_text = """
 투자 포트폴리오 분석 보고서
 ========================
 
@@ -48,15 +45,27 @@ def create_very_large_pdf():
 현금및현금성자산 증감: 10,000,000
 
 """ * 3  # Repeat 3 times to make it larger
-        
-        # Add text
-        text_rect = fitz.Rect(50, 50, 545, 792)
-        page.insert_textbox(text_rect, long_text, fontsize=10, fontname="helv")
-        
-        # Add some graphical elements to increase size
-        for i in range(10):
-            page.draw_circle(fitz.Point(100 + i * 40, 700), 20)
-            page.draw_rect(fitz.Rect(100 + i * 40, 720, 120 + i * 40, 740))
+    
+    # Add text
+    text_rect = fitz.Rect(50, 50, 545, 792)
+    page.insert_textbox(text_rect, long_text, fontsize=10, fontname="helv")
+    
+    # Add some graphical elements to increase size
+    for i in range(10):
+        page.draw_circle(fitz.Point(100 + i * 40, 700), 20)
+        page.draw_rect(fitz.Rect(100 + i * 40, 720, 120 + i * 40, 740))
+    
+    # insert_pdf keeps each copy's drawing streams separate (fullcopy_page
+    # merges them), so the output stays well above the 0.5MB split limit below
+    pdf = fitz.open()
+    for _ in range(500):
+        pdf.insert_pdf(template)
+    template.close()
+    
+    # Number-only header: helv has no Hangul glyphs, and non-Latin text makes
+    # MuPDF run a slow fallback-font lookup on every page
+    for page_num, page in enumerate(pdf):
+        page.insert_text((50, 40), f"{page_num + 1} / 500", fontsize=10, fontname="helv")
     
     content = pdf.tobytes()
     pdf.close()
@@ -25,25 +25,13 @@ def update_document_types():
     session = Session()
     
     try:
-        # 마인이스의 기타문서를 찾아서 재무제표로 변경
-        docs = session.query(FinancialDoc).filter_by(
-            company_name="마인이스",
-            doc_type="기타문서"
-        ).all()
-        
-        for doc in docs:
-            doc.doc_type = "재무제표"
-            print(f"✅ 업데이트: {doc.company_name} {doc.year}년 - {doc.doc_type}")
-        
-        # 사업보고서도 재무제표로 변경
-        annual_docs = session.query(FinancialDoc).filter_by(
-            company_name="마인이스",
-            doc_type="사업보고서"
-        ).all()
+        # 마인이스의 기타문서/사업보고서를 재무제표로 변경 (UPDATE 한 번으로 처리)
+        updated_count = session.query(FinancialDoc).filter(
+            FinancialDoc.company_name == "마인이스",
+            FinancialDoc.doc_type.in_(["기타문서", "사업보고서"])
+        ).update({"doc_type": "재무제표"}, synchronize_session=False)
         
-        for doc in annual_docs:
-            doc.doc_type = "재무제표"
-            print(f"✅ 업데이트: {doc.company_name} {doc.year}년 - {doc.doc_type}")
+        print(f"✅ 업데이트: 마인이스 문서 {updated_count}건 - 재무제표")
         
         session.commit()
         print("\n✅ 데이터베이스 업데이트 완료!")
@@ -2,31 +2,39 @@
 """Test backend connection and diagnose issues"""
 
 import requests
+import io
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Test configurations
 BASE_URL = "http://127.0.0.1:8081"
 FRONTEND_ORIGIN = "http://localhost:4001"
 
-def test_health():
+# One keep-alive session shared by all probes (urllib3's pool is thread-safe)
+SESSION = requests.Session()
+
+def test_health(out=None):
     """Test health endpoint"""
-    print("1. Testing health endpoint...")
+    out = out or sys.stdout
+    print("1. Testing health endpoint...", file=out)
     try:
-        response = requests.get(f"{BASE_URL}/health")
-        print(f"   Status: {response.status_code}")
-        print(f"   Response: {response.json()}")
+        response = SESSION.get(f"{BASE_URL}/health")
+        print(f"   Status: {response.status_code}", file=out)
+        print(f"   Response: {response.json()}", file=out)
         return response.status_code == 200
     except Exception as e:
-        print(f"   Error: {e}")
+        print(f"   Error: {e}", file=out)
         return False
 
-def test_cors_preflight():
+def test_cors_preflight(out=None):
     """Test CORS preflight request"""
-    print("\n2. Testing CORS preflight...")
+    out = out or sys.stdout
+    print("\n2. Testing CORS preflight...", file=out)
     try:
-        response = requests.options(
+        response = SESSION.options(
             f"{BASE_URL}/api/chat/",
             headers={
                 "Origin": FRONTEND_ORIGIN,
@@ -34,27 +42,24 @@ def test_cors_preflight():
                 "Access-Control-Request-Headers": "content-type"
             }
         )
-        print(f"   Status: {response.status_code}")
-        print(f"   CORS Headers:")
+        print(f"   Status: {response.status_code}", file=out)
+        print(f"   CORS Headers:", file=out)
         for header in ["Access-Control-Allow-Origin", "Access-Control-Allow-Methods", 
                       "Access-Control-Allow-Headers", "Access-Control-Allow-Credentials"]:
             value = response.headers.get(header, "Not present")
-            print(f"     {header}: {value}")
+            print(f"     {header}: {value}", file=out)
         return response.status_code == 200
     except Exception as e:
-        print(f"   Error: {e}")
+        print(f"   Error: {e}", file=out)
         return False
 
-def test_chat_endpoint():
+def test_chat_endpoint(out=None):
     """Test chat endpoint with actual request"""
-    print("\n3. Testing chat endpoint...")
-    
-    # Test with test mode first
-    import os
-    os.environ["CLAUDE_TEST_MODE"] = "true"
+    out = out or sys.stdout
+    print("\n3. Testing chat endpoint...", file=out)
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/chat/",
             json={"question": "마인이스의 2024년 매출액은 얼마입니까?"},
             headers={
@@ -62,22 +67,23 @@ def test_chat_endpoint():
                 "Origin": FRONTEND_ORIGIN
             }
         )
-        print(f"   Status: {response.status_code}")
+        print(f"   Status: {response.status_code}", file=out)
         if response.status_code == 200:
-            print(f"   Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+            print(f"   Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}", file=out)
         else:
-            print(f"   Error Response: {response.text}")
+            print(f"   Error Response: {response.text}", file=out)
         return response.status_code == 200
     except Exception as e:
-        print(f"   Error: {e}")
+        print(f"   Error: {e}", file=out)
         return False
 
-def test_from_frontend_perspective():
+def test_from_frontend_perspective(out=None):
     """Test exactly how frontend would call the API"""
-    print("\n4. Testing from frontend perspective...")
+    out = out or sys.stdout
+    print("\n4. Testing from frontend perspective...", file=out)
     try:
         # Simulate axios request
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/chat",  # Without trailing slash first
             json={"question": "테스트 질문입니다"},
             headers={
@@ -88,15 +94,15 @@ def test_from_frontend_perspective():
             },
             allow_redirects=True  # Follow redirects automatically
         )
-        print(f"   Status: {response.status_code}")
-        print(f"   Final URL: {response.url}")
+        print(f"   Status: {response.status_code}", file=out)
+        print(f"   Final URL: {response.url}", file=out)
         if response.status_code == 200:
-            print(f"   Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+            print(f"   Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}", file=out)
         else:
-            print(f"   Error Response: {response.text}")
+            print(f"   Error Response: {response.text}", file=out)
         return response.status_code == 200
     except Exception as e:
-        print(f"   Error: {e}")
+        print(f"   Error: {e}", file=out)
         return False
 
 def check_file_system():
@@ -118,13 +124,26 @@ def main():
     """Run all tests"""
     print("=== Backend Connection Diagnostics ===\n")
     
-    results = {
-        "Health Check": test_health(),
-        "CORS Preflight": test_cors_preflight(),
-        "Chat Endpoint": test_chat_endpoint(),
-        "Frontend Simulation": test_from_frontend_perspective(),
-        "File System": check_file_system()
+    # Test with test mode first; set before the probes start so no thread mutates the environment
+    os.environ["CLAUDE_TEST_MODE"] = "true"
+    
+    # The HTTP probes are independent, so run them concurrently; each writes
+    # to its own buffer and the buffers are printed in order afterwards
+    probes = {
+        "Health Check": test_health,
+        "CORS Preflight": test_cors_preflight,
+        "Chat Endpoint": test_chat_endpoint,
+        "Frontend Simulation": test_from_frontend_perspective,
     }
+    outputs = {name: io.StringIO() for name in probes}
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {name: executor.submit(probe, outputs[name]) for name, probe in probes.items()}
+    
+    results = {}
+    for name, future in futures.items():
+        sys.stdout.write(outputs[name].getvalue())
+        results[name] = future.result()
+    results["File System"] = check_file_system()
     
     print("\n=== Summary ===")
     for test, passed in results.items():
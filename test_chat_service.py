@@ -10,44 +10,51 @@ from loguru import logger
 # Enable test mode
 os.environ["CLAUDE_TEST_MODE"] = "true"
 
-async def test_chat_service():
-    """Test the chat service directly"""
+# Full tracebacks only with VERBOSE=1
+_VERBOSE = os.getenv("VERBOSE") == "1"
+
+async def run_query(question: str):
+    """Run one query on its own session (sessions are not safe to share concurrently)"""
     db = SessionLocal()
     try:
-        # Create chat service
         chat_service = ChatService(db=db)
-        
-        # Test questions
-        test_questions = [
-            "마인이스의 2024년 매출액은 얼마입니까?",
-            "우나스텔라의 최근 실적은 어떻습니까?",
-            "설로인의 사업 현황을 알려주세요"
-        ]
-        
-        for question in test_questions:
-            print(f"\n{'='*50}")
-            print(f"Testing question: {question}")
-            print('='*50)
-            
-            try:
-                response = await chat_service.process_query(
-                    question=question,
-                    context=None
-                )
-                
-                print(f"✓ Success!")
-                print(f"Answer: {response.answer[:200]}...")
-                print(f"Sources: {response.sources}")
-                print(f"Processing time: {response.processing_time:.2f}s")
-                
-            except Exception as e:
-                print(f"✗ Error: {type(e).__name__}: {str(e)}")
-                import traceback
-                traceback.print_exc()
-    
+        return await chat_service.process_query(question=question, context=None)
     finally:
         db.close()
 
+async def test_chat_service():
+    """Test the chat service directly"""
+    # Test questions
+    test_questions = [
+        "마인이스의 2024년 매출액은 얼마입니까?",
+        "우나스텔라의 최근 실적은 어떻습니까?",
+        "설로인의 사업 현황을 알려주세요"
+    ]
+    
+    # The queries are independent, so run them concurrently (one session
+    # each) and report in order
+    responses = await asyncio.gather(
+        *(run_query(question) for question in test_questions),
+        return_exceptions=True
+    )
+    
+    for question, response in zip(test_questions, responses):
+        print(f"\n{'='*50}")
+        print(f"Testing question: {question}")
+        print('='*50)
+        
+        if isinstance(response, Exception):
+            print(f"✗ Error: {type(response).__name__}: {str(response)}")
+            if _VERBOSE:
+                import traceback
+                traceback.print_exception(response)
+            continue
+        
+        print(f"✓ Success!")
+        print(f"Answer: {response.answer[:200]}...")
+        print(f"Sources: {response.sources}")
+        print(f"Processing time: {response.processing_time:.2f}s")
+
 def test_document_service():
     """Test document service separately"""
     from app.services.document_service import DocumentService
@@ -96,8 +103,9 @@ def test_claude_service():
         print(f"  - Client initialized: {claude.client is not None}")
     except Exception as e:
         print(f"✗ Failed to initialize Claude service: {e}")
-        import traceback
-        traceback.print_exc()
+        if _VERBOSE:
+            import traceback
+            traceback.print_exc()
 
 async def main():
     """Run all tests"""
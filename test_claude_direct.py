@@ -2,12 +2,15 @@
 """Test Claude API directly"""
 
 import os
-from anthropic import Anthropic
+from tests._clients import get_client
 from dotenv import load_dotenv
 
 # Load environment
 load_dotenv()
 
+# Full tracebacks only with VERBOSE=1
+_VERBOSE = os.getenv("VERBOSE") == "1"
+
 # Get API key
 api_key = os.getenv("CLAUDE_API_KEY")
 if not api_key:
@@ -19,7 +22,7 @@ print(f"API Key starts with: {api_key[:10] if api_key else 'None'}")
 
 # Test simple message
 try:
-    client = Anthropic(api_key=api_key)
+    client = get_client(api_key)
     
     message = client.messages.create(
         model="claude-3-haiku-20240307",
@@ -37,5 +40,6 @@ try:
     
 except Exception as e:
     print(f"\n✗ Claude API call failed: {type(e).__name__}: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+    if _VERBOSE:
+        import traceback
+        traceback.print_exc()
\ No newline at end of file
@@ -6,12 +6,19 @@ Direct test of Claude API with PDF
 import os
 import sys
 import base64
+import mmap
 from dotenv import load_dotenv
-from anthropic import Anthropic
+from tests._clients import get_client
+
+# Raw bytes per base64 chunk (multiple of 3)
+BASE64_CHUNK_SIZE = 3 * 1024 * 1024
 
 # Load environment variables
 load_dotenv()
 
+# Full tracebacks only with VERBOSE=1
+_VERBOSE = os.getenv("VERBOSE") == "1"
+
 # Get API key
 api_key = os.getenv("CLAUDE_API_KEY")
 if not api_key:
@@ -22,17 +29,22 @@ print(f"API Key exists: {bool(api_key)}")
 print(f"API Key prefix: {api_key[:10]}...")
 
 # Initialize client
-client = Anthropic(api_key=api_key)
+client = get_client(api_key)
 
-# Read PDF
+# Map the PDF rather than reading it into a bytes copy; b64encode reads the
+# mapping directly from the page cache
 pdf_path = "data/financial_docs/마인이스/2024/마인이스_2024_재무제표.pdf"
-with open(pdf_path, "rb") as f:
-    pdf_content = f.read()
-
-print(f"PDF size: {len(pdf_content) / 1024:.2f} KB")
-
-# Convert to base64
-pdf_base64 = base64.b64encode(pdf_content).decode('utf-8')
+with open(pdf_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pdf_content:
+    print(f"PDF size: {len(pdf_content) / 1024:.2f} KB")
+    
+    # Convert to base64 in chunks so no full-size intermediate bytes object is
+    # built; the chunk size is a multiple of 3 so only the last chunk is padded
+    encoded = bytearray()
+    with memoryview(pdf_content) as view:
+        for start in range(0, len(view), BASE64_CHUNK_SIZE):
+            encoded += base64.b64encode(view[start:start + BASE64_CHUNK_SIZE])
+    pdf_base64 = encoded.decode('ascii')
+    del encoded
 
 # Test with Claude
 try:
@@ -73,5 +85,6 @@ try:
     
 except Exception as e:
     print(f"\nError: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+    if _VERBOSE:
+        import traceback
+        traceback.print_exc()
\ No newline at end of file
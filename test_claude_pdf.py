@@ -1,11 +1,170 @@
 #!/usr/bin/env python3
 """Test Claude API with PDF document"""
 
+import asyncio
 import os
-import base64
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 
+from tests._pdf_io import iter_pdf_chunks
+
+try:
+    import pybase64  # SIMD base64 codec, same API as the stdlib module
+except ImportError:
+    import base64 as pybase64
+
+# Raw bytes read and encoded per step (multiple of 3, so only the last chunk is padded)
+BASE64_CHUNK_SIZE = 3 * 65536
+
+
+def encode_pdf_base64(pdf_path: str) -> str:
+    """Read and encode incrementally so the raw file is never held in memory
+    next to its base64 copy"""
+    encoded = bytearray()
+    for chunk in iter_pdf_chunks(pdf_path, BASE64_CHUNK_SIZE):
+        encoded += pybase64.b64encode(chunk)
+    return encoded.decode('ascii')
+
+
+def load_pdf_base64(pdf_path: str) -> str:
+    """Return the PDF's base64 text, reusing the <pdf_path>.b64 sidecar if it
+    is newer than the PDF (set WVP_DISABLE_B64_CACHE=1 to always re-encode)"""
+    if os.getenv("WVP_DISABLE_B64_CACHE"):
+        return encode_pdf_base64(pdf_path)
+
+    cache_path = pdf_path + ".b64"
+    if (os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(pdf_path)):
+        with open(cache_path, "r", encoding="ascii") as f:
+            print(f"Using cached base64: {cache_path}")
+            return f.read()
+
+    pdf_base64 = encode_pdf_base64(pdf_path)
+    # Write to a temp file and rename so an interrupted run never leaves a
+    # truncated cache behind
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="ascii") as f:
+        f.write(pdf_base64)
+    os.replace(tmp_path, cache_path)
+    return pdf_base64
+
+
+async def try_beta_document(client: AsyncAnthropic, pdf_base64: str):
+    """Approach 1: Using beta API with document type (Sonnet model)"""
+    return await client.beta.messages.create(
+        model="claude-3-5-sonnet-20241022",
+        max_tokens=1000,
+        messages=[
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "document",
+                        "source": {
+                            "type": "base64",
+                            "media_type": "application/pdf",
+                            "data": pdf_base64
+                        }
+                    },
+                    {
+                        "type": "text",
+                        "text": "이 PDF 문서의 첫 페이지에 어떤 내용이 있나요?"
+                    }
+                ]
+            }
+        ]
+    )
+
+
+async def try_image(client: AsyncAnthropic, pdf_base64: str):
+    """Approach 2: Using regular API with image type (PDF as image)"""
+    return await client.messages.create(
+        model="claude-3-haiku-20240307",
+        max_tokens=1000,
+        messages=[
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": "application/pdf",
+                            "data": pdf_base64
+                        }
+                    },
+                    {
+                        "type": "text",
+                        "text": "이 문서의 첫 페이지에 어떤 내용이 있나요?"
+                    }
+                ]
+            }
+        ]
+    )
+
+
+async def try_tools(client: AsyncAnthropic, pdf_base64: str):
+    """Approach 3: Using tools/functions API"""
+    return await client.messages.create(
+        model="claude-3-5-sonnet-20241022",
+        max_tokens=1000,
+        tools=[
+            {
+                "name": "analyze_document",
+                "description": "Analyze a PDF document",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "document_content": {
+                            "type": "string",
+                            "description": "The content of the document"
+                        }
+                    }
+                }
+            }
+        ],
+        messages=[
+            {
+                "role": "user",
+                "content": f"Please analyze this PDF document (base64): {pdf_base64[:100]}..."
+            }
+        ]
+    )
+
+
+async def main(api_key: str):
+    client = AsyncAnthropic(api_key=api_key)
+    
+    # Read a sample PDF
+    pdf_path = "data/financial_docs/마인이스/2024/마인이스_2024_재무제표.pdf"
+    
+    pdf_size = os.path.getsize(pdf_path)
+    pdf_base64 = load_pdf_base64(pdf_path)
+    
+    print(f"\nPDF loaded: {pdf_size} bytes")
+    
+    # Try different approaches; they are independent, so run them
+    # concurrently and report in order
+    approaches = [
+        ("1. Testing beta API with document type (Sonnet)...", "Beta API with document type", try_beta_document),
+        ("2. Testing regular API with image type...", "Regular API with image type", try_image),
+        ("3. Testing with tools API...", "Tools API", try_tools),
+    ]
+    results = await asyncio.gather(
+        *(approach(client, pdf_base64) for _, _, approach in approaches),
+        return_exceptions=True
+    )
+    
+    for (heading, name, _), result in zip(approaches, results):
+        print(f"\n{heading}")
+        if isinstance(result, Exception):
+            print(f"✗ {name} failed: {type(result).__name__}: {result}")
+            continue
+        print(f"✓ {name} successful!")
+        text = result.content[0].text if result.content and getattr(result.content[0], "text", None) else None
+        print(f"Response: {text[:200] if text else 'No text response'}...")
+
+
 # Load environment
 load_dotenv()
 
@@ -18,116 +177,8 @@ print(f"API Key present: {bool(api_key)}")
 
 # Test with PDF
 try:
-    client = Anthropic(api_key=api_key)
-    
-    # Read a sample PDF
-    pdf_path = "data/financial_docs/마인이스/2024/마인이스_2024_재무제표.pdf"
-    
-    with open(pdf_path, "rb") as f:
-        pdf_content = f.read()
-    
-    pdf_base64 = base64.b64encode(pdf_content).decode('utf-8')
-    
-    print(f"\nPDF loaded: {len(pdf_content)} bytes")
-    
-    # Try different approaches
-    
-    # Approach 1: Using beta API with document type (Sonnet model)
-    print("\n1. Testing beta API with document type (Sonnet)...")
-    try:
-        message = client.beta.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=1000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "document",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "application/pdf",
-                                "data": pdf_base64
-                            }
-                        },
-                        {
-                            "type": "text",
-                            "text": "이 PDF 문서의 첫 페이지에 어떤 내용이 있나요?"
-                        }
-                    ]
-                }
-            ]
-        )
-        print("✓ Beta API with document type successful!")
-        print(f"Response: {message.content[0].text[:200]}...")
-    except Exception as e:
-        print(f"✗ Beta API with document type failed: {type(e).__name__}: {e}")
-    
-    # Approach 2: Using regular API with image type (PDF as image)
-    print("\n2. Testing regular API with image type...")
-    try:
-        message = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=1000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "application/pdf",
-                                "data": pdf_base64
-                            }
-                        },
-                        {
-                            "type": "text",
-                            "text": "이 문서의 첫 페이지에 어떤 내용이 있나요?"
-                        }
-                    ]
-                }
-            ]
-        )
-        print("✓ Regular API with image type successful!")
-        print(f"Response: {message.content[0].text[:200]}...")
-    except Exception as e:
-        print(f"✗ Regular API with image type failed: {type(e).__name__}: {e}")
-    
-    # Approach 3: Using tools/functions API
-    print("\n3. Testing with tools API...")
-    try:
-        message = client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=1000,
-            tools=[
-                {
-                    "name": "analyze_document",
-                    "description": "Analyze a PDF document",
-                    "input_schema": {
-                        "type": "object",
-                        "properties": {
-                            "document_content": {
-                                "type": "string",
-                                "description": "The content of the document"
-                            }
-                        }
-                    }
-                }
-            ],
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"Please analyze this PDF document (base64): {pdf_base64[:100]}..."
-                }
-            ]
-        )
-        print("✓ Tools API successful!")
-        print(f"Response: {message.content[0].text[:200] if message.content and message.content[0].text else 'No text response'}...")
-    except Exception as e:
-        print(f"✗ Tools API failed: {type(e).__name__}: {e}")
-    
+    asyncio.run(main(api_key))
 except Exception as e:
     print(f"\n✗ General error: {type(e).__name__}: {e}")
     import traceback
-    traceback.print_exc()
\ No newline at end of file
+    traceback.print_exc()
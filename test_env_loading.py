@@ -5,11 +5,7 @@ import os
 import sys
 from pathlib import Path
 
-# Load .env file
 from dotenv import load_dotenv
-load_dotenv()
-
-print("=== Environment Variable Test ===\n")
 
 # Check critical environment variables
 env_vars = [
@@ -20,8 +16,18 @@ env_vars = [
     "SECRET_KEY"
 ]
 
+# Load .env file, unless the shell (CI, Docker) already exported everything
+if not all(var in os.environ for var in env_vars):
+    load_dotenv(override=False, verbose=False)
+
+print("=== Environment Variable Test ===\n")
+
+# Snapshot the environment once (env cache) instead of going through
+# os.environ's wrapper for every lookup
+env = dict(os.environ)
+
 for var in env_vars:
-    value = os.getenv(var)
+    value = env.get(var)
     if value:
         # Show only first 10 chars for sensitive data
         display_value = value[:10] + "..." if len(value) > 10 else value
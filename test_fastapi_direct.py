@@ -8,10 +8,10 @@ from fastapi.testclient import TestClient
 from app.main import app
 import json
 
-# Create test client
-client = TestClient(app)
+# Origin the frontend dev server sends with every request
+FRONTEND_ORIGIN = "http://localhost:4001"
 
-def test_health():
+def test_health(client: TestClient):
     """Test health endpoint"""
     print("=== Testing Health Endpoint ===")
     response = client.get("/health")
@@ -19,15 +19,14 @@ def test_health():
     print(f"Response: {response.json()}")
     print()
 
-def test_chat_endpoint():
+def test_chat_endpoint(client: TestClient):
     """Test chat endpoint"""
     print("=== Testing Chat Endpoint ===")
     
     # Test with trailing slash
     response = client.post(
         "/api/chat/",
-        json={"question": "마인이스의 2024년 매출액은?"},
-        headers={"Origin": "http://localhost:4001"}
+        json={"question": "마인이스의 2024년 매출액은?"}
     )
     
     print(f"Status: {response.status_code}")
@@ -52,13 +51,12 @@ def test_chat_endpoint():
         value = response.headers.get(header, "Not present")
         print(f"  {header}: {value}")
 
-def test_cors_preflight():
+def test_cors_preflight(client: TestClient):
     """Test CORS preflight"""
     print("\n=== Testing CORS Preflight ===")
     response = client.options(
         "/api/chat/",
         headers={
-            "Origin": "http://localhost:4001",
             "Access-Control-Request-Method": "POST",
             "Access-Control-Request-Headers": "content-type"
         }
@@ -71,7 +69,20 @@ def test_cors_preflight():
         value = response.headers.get(header, "Not present")
         print(f"  {header}: {value}")
 
+def make_client() -> TestClient:
+    """TestClient that sends the frontend Origin with every request
+
+    Use one as a context manager for every test, so the app's startup runs once.
+    """
+    client = TestClient(app)
+    client.headers.update({"Origin": FRONTEND_ORIGIN})
+    return client
+
+def main():
+    with make_client() as client:
+        test_health(client)
+        test_cors_preflight(client)
+        test_chat_endpoint(client)
+
 if __name__ == "__main__":
-    test_health()
-    test_cors_preflight()
-    test_chat_endpoint()
\ No newline at end of file
+    main()
@@ -19,7 +19,8 @@ from loguru import logger
 async def test_interactive_mode():
     """Test the interactive mode with various questions"""
     
-    # Initialize service
+    # Initialize service (its Anthropic client, and so its connections, are
+    # reused for every question)
     service = InteractiveClaudeService()
     db = SessionLocal()
     
@@ -39,6 +40,8 @@ async def test_interactive_mode():
             "2024년 매출이 가장 높은 회사는 어디인가요?"
         ]
         
+        # The service resets shared protocol state per call, so the questions
+        # run one after another, back to back
         for i, question in enumerate(test_questions, 1):
             print(f"\n{'='*60}")
             print(f"Test {i}: {question}")
@@ -70,9 +73,6 @@ async def test_interactive_mode():
                 print(f"❌ Error: {e}")
                 logger.exception("Test failed")
             
-            # Wait a bit between tests
-            await asyncio.sleep(2)
-            
     finally:
         db.close()
 
@@ -3,9 +3,23 @@
 Test PDF content extraction
 """
 
+import re
 import fitz  # PyMuPDF
 import sys
 
+# Revenue keywords, matched in one pass per page
+REVENUE_RE = re.compile(r"매출|수익|revenue|sales|1,234,567", re.IGNORECASE)
+
+# Characters shown on each side of a keyword hit
+CONTEXT_CHARS = 40
+
+# Text extraction flags for the keyword scan: keep whitespace and the mediabox
+# clip, but skip ligature preservation
+TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
+# Height (pt) of the page strip shown as a preview
+PREVIEW_HEIGHT = 200
+
 pdf_path = "data/financial_docs/마인이스/2024/마인이스_2024_재무제표.pdf"
 
 try:
@@ -17,19 +31,23 @@ try:
     
     # Extract text from first few pages
     for page_num in range(min(3, len(pdf_document))):
-        page = pdf_document[page_num]
-        text = page.get_text()
+        page = pdf_document.load_page(page_num)
         
         print(f"\n--- Page {page_num + 1} ---")
-        print(text[:500])  # First 500 characters
+        # Only extract the top of the page for the preview
+        preview = page.get_text(clip=fitz.Rect(0, 0, page.rect.width, PREVIEW_HEIGHT))
+        print(preview[:500])  # First 500 characters
         
-        # Look for revenue/sales keywords
-        if any(keyword in text for keyword in ["매출", "수익", "revenue", "sales", "1,234,567"]):
+        # Look for revenue/sales keywords in a single pass over the page text
+        textpage = page.get_textpage(flags=TEXT_FLAGS)
+        text = textpage.extractText()
+        textpage = None  # Release the MuPDF text page
+        hits = list(REVENUE_RE.finditer(text))
+        if hits:
             print("\n[FOUND REVENUE DATA]")
-            # Find lines containing revenue info
-            for line in text.split('\n'):
-                if any(keyword in line for keyword in ["매출", "수익", "1,234,567"]):
-                    print(f"  > {line.strip()}")
+            for match in hits:
+                context = text[max(0, match.start() - CONTEXT_CHARS):match.end() + CONTEXT_CHARS]
+                print(f"  > {' '.join(context.split())}")
     
     pdf_document.close()
     
@@ -7,6 +7,28 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
+# Fixed parts of the search results, built once; handlers only fill in the company
+_DOC_TEMPLATE = {
+    "id": 1,
+    "companyName": "",
+    "docType": "사업보고서",
+    "year": 2024,
+    "filePath": "",
+    "createdAt": "2024-01-01T00:00:00",
+    "updatedAt": "2024-01-01T00:00:00"
+}
+
+_NEWS_TEMPLATE = {
+    "id": 1,
+    "companyName": "",
+    "title": "",
+    "content": "테스트 뉴스 내용입니다.",
+    "source": "테스트 신문",
+    "publishedDate": "2024-01-01T00:00:00",
+    "createdAt": "2024-01-01T00:00:00",
+    "updatedAt": "2024-01-01T00:00:00"
+}
+
 app = FastAPI(title="Portfolio Q&A Test Server", version="0.1.0")
 
 # Configure CORS
@@ -54,32 +76,11 @@ async def chat_endpoint(request: dict):
 
 @app.get("/api/documents/search")
 async def search_documents(company: str = "마인이스", limit: int = 5):
-    return [
-        {
-            "id": 1,
-            "companyName": company,
-            "docType": "사업보고서",
-            "year": 2024,
-            "filePath": f"/test/{company}_2024.pdf",
-            "createdAt": "2024-01-01T00:00:00",
-            "updatedAt": "2024-01-01T00:00:00"
-        }
-    ]
+    return [{**_DOC_TEMPLATE, "companyName": company, "filePath": f"/test/{company}_2024.pdf"}]
 
 @app.get("/api/news/search")
 async def search_news(company: str = "마인이스", limit: int = 5):
-    return [
-        {
-            "id": 1,
-            "companyName": company,
-            "title": f"{company} 테스트 뉴스",
-            "content": "테스트 뉴스 내용입니다.",
-            "source": "테스트 신문",
-            "publishedDate": "2024-01-01T00:00:00",
-            "createdAt": "2024-01-01T00:00:00",
-            "updatedAt": "2024-01-01T00:00:00"
-        }
-    ]
+    return [{**_NEWS_TEMPLATE, "companyName": company, "title": f"{company} 테스트 뉴스"}]
 
 if __name__ == "__main__":
     print("🚀 Starting Portfolio Q&A Test Server...")
@@ -87,4 +88,6 @@ if __name__ == "__main__":
     print("📍 Backend: http://localhost:8080")
     print("📍 API Docs: http://localhost:8080/docs")
     
-    uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
+    # uvicorn already picks uvloop/httptools when installed; the access log is
+    # off to keep per-request overhead down
+    uvicorn.run(app, host="0.0.0.0", port=8080, access_log=False)
\ No newline at end of file
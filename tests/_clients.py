@@ -0,0 +1,18 @@
+"""
+Shared API clients for the standalone test scripts
+
+Building an Anthropic client sets up its own HTTP connection pool, so scripts
+that run in the same process should share one instead of constructing their own.
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+from anthropic import Anthropic
+
+
+@lru_cache(maxsize=4)
+def get_client(api_key: Optional[str] = None) -> Anthropic:
+    """Return the process-wide Anthropic client for api_key (defaults to CLAUDE_API_KEY)"""
+    return Anthropic(api_key=api_key or os.getenv("CLAUDE_API_KEY"))
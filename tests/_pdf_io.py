@@ -0,0 +1,51 @@
+"""
+Shared PDF file loading for the standalone test scripts
+
+Reads straight into one preallocated buffer with readinto, so a PDF is not
+allocated once by read() and then copied again.
+"""
+
+import os
+from typing import Iterator
+
+
+def load_pdf(pdf_path: str) -> bytearray:
+    """Return the whole PDF as a bytearray (accepted by fitz.open(stream=...) and base64)"""
+    size = os.path.getsize(pdf_path)
+    buf = bytearray(size)
+    view = memoryview(buf)
+    with open(pdf_path, "rb", buffering=0) as f:
+        read = 0
+        while read < size:
+            n = f.readinto(view[read:])
+            if not n:
+                break
+            read += n
+    view.release()
+    # The file may have shrunk since getsize
+    del buf[read:]
+    return buf
+
+
+def iter_pdf_chunks(pdf_path: str, chunk_size: int) -> Iterator[memoryview]:
+    """Yield the PDF in chunk_size pieces, all read into the same reusable buffer
+
+    Every piece except the last is exactly chunk_size bytes (short reads are
+    retried until the buffer is full). Each yielded view is only valid until
+    the next one is requested.
+    """
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    with open(pdf_path, "rb", buffering=0) as f:
+        while True:
+            filled = 0
+            while filled < chunk_size:
+                n = f.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+            if not filled:
+                break
+            yield view[:filled]
+            if filled < chunk_size:
+                break